@@ -1,5 +1,6 @@
 """应用配置管理"""
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic_settings import BaseSettings
@@ -48,5 +49,16 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    获取全局配置实例（只构建一次，后续调用直接返回缓存对象）
+
+    Returns:
+        Settings: 应用配置
+    """
+    return Settings()
+
+
 # 全局配置实例
-settings = Settings()
+settings = get_settings()
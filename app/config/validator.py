@@ -190,8 +190,9 @@ class ConfigValidator:
         Raises:
             ConfigurationError: If any validation fails
         """
-        from app.config.settings import settings
+        from app.config.settings import get_settings
 
+        settings = get_settings()
         ConfigValidator.validate_domains_config(settings.DOMAINS_CONFIG)
         ConfigValidator.validate_modes_config(settings.MODES_CONFIG)
 
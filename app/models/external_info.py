@@ -1,5 +1,6 @@
 """Models describing structured external information for GrillRadar."""
 from datetime import datetime
+from itertools import islice
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
@@ -184,35 +185,33 @@ class ExternalInfoSummary(BaseModel):
 
         if self.job_descriptions:
             lines.append(f"**找到 {len(self.job_descriptions)} 个相关JD**")
-            for jd in self.job_descriptions[:3]:  # 最多显示3个
+            for jd in islice(self.job_descriptions, 3):  # 最多显示3个
                 lines.append(f"- {jd.company} - {jd.position}")
 
         if self.interview_experiences:
             lines.append(f"\n**找到 {len(self.interview_experiences)} 条相关面经**")
-            for exp in self.interview_experiences[:3]:  # 最多显示3个
+            for exp in islice(self.interview_experiences, 3):  # 最多显示3个
                 lines.append(f"- {exp.company} - {exp.position} ({exp.interview_type})")
 
         if self.aggregated_keywords:
-            keywords_str = "、".join(self.aggregated_keywords[:15])
+            keywords_str = "、".join(islice(self.aggregated_keywords, 15))
             lines.append(f"\n**核心技能要求**: {keywords_str}")
 
         if self.high_frequency_questions:
             lines.append(f"\n**高频面试题**:")
-            for q in self.high_frequency_questions[:5]:
+            for q in islice(self.high_frequency_questions, 5):
                 lines.append(f"- {q}")
 
         if self.keyword_trends:
             trend_str = "、".join(
-                [
-                    f"{trend.keyword}(x{trend.frequency})"
-                    for trend in self.keyword_trends[:8]
-                ]
+                f"{trend.keyword}(x{trend.frequency})"
+                for trend in islice(self.keyword_trends, 8)
             )
             lines.append(f"\n**高频技能趋势**: {trend_str}")
 
         if self.topic_trends:
             topic_trend_str = "、".join(
-                [f"{trend.topic}(x{trend.frequency})" for trend in self.topic_trends[:6]]
+                f"{trend.topic}(x{trend.frequency})" for trend in islice(self.topic_trends, 6)
             )
             lines.append(f"\n**热点面试主题**: {topic_trend_str}")
 
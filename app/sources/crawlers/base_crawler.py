@@ -4,15 +4,67 @@
 定义所有爬虫的统一接口
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
 import logging
 import time
 import httpx
 from app.sources.crawlers.models import RawItem, CrawlerConfig, CrawlerResult
 from app.sources.crawlers.cache_manager import get_cache_manager, CacheManager
 
+try:
+    import orjson
+except ImportError:  # 可选依赖：未安装时回退到标准库json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 全局HTTP客户端实例（所有爬虫共享连接池，keep-alive复用TCP/TLS连接）
+# 按是否校验证书分别保存，两类客户端各自复用连接
+_http_clients: Dict[bool, httpx.Client] = {}
+
+
+def get_http_client(verify: bool = False) -> httpx.Client:
+    """
+    获取全局HTTP客户端实例
+
+    超时等请求级参数由调用方在每次请求时传入
+
+    Args:
+        verify: 是否校验TLS证书。网页爬虫默认不校验（避免某些网站的SSL问题），
+                JSON API等外部接口应传入True
+
+    Returns:
+        httpx.Client: 共享的HTTP客户端
+    """
+    client = _http_clients.get(verify)
+
+    if client is None:
+        client = httpx.Client(
+            verify=verify,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        _http_clients[verify] = client
+
+    return client
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    解析JSON响应体（优先使用orjson，直接解析原始字节）
+
+    Args:
+        content: 响应的原始字节内容
+
+    Returns:
+        解析后的JSON数据
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class BaseCrawler(ABC):
     """
@@ -87,6 +139,22 @@ class BaseCrawler(ABC):
 
         return result
 
+    async def crawl_async(self, domain: str, keywords: List[str]) -> CrawlerResult:
+        """
+        异步爬取（带缓存）
+
+        在工作线程中执行crawl_with_cache，请求仍走共享的HTTP连接池；
+        多个数据源可用asyncio.gather并发抓取，总耗时取决于最慢的数据源
+
+        Args:
+            domain: 目标领域
+            keywords: 关键词列表
+
+        Returns:
+            CrawlerResult: 爬取结果（可能来自缓存）
+        """
+        return await asyncio.to_thread(self.crawl_with_cache, domain, keywords)
+
     def _get_cache_key(self, domain: str, keywords: List[str]) -> str:
         """生成缓存键"""
         keywords_str = "_".join(sorted(keywords))
@@ -100,7 +168,7 @@ class BaseCrawler(ABC):
         # 从缓存读取
         cached_data = self.cache_manager.get(cache_key)
         if cached_data:
-            self.logger.info(f"Cache hit for {cache_key}")
+            self.logger.info("Cache hit for %s", cache_key)
             # 将字典转换回CrawlerResult
             return CrawlerResult(**cached_data)
 
@@ -132,31 +200,31 @@ class BaseCrawler(ABC):
             **kwargs: 传递给httpx的其他参数
 
         Returns:
-            Response对象，失败返回None
+            Response对象（条件请求未修改时状态码为304），失败返回None
         """
         headers = kwargs.pop('headers', {})
         headers.setdefault('User-Agent', self.config.user_agent)
 
+        client = get_http_client()
+
         for attempt in range(self.config.retry_times + 1):
             try:
-                with httpx.Client(
+                response = client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
                     timeout=self.config.timeout,
-                    verify=False,  # 禁用SSL验证以避免某些网站的SSL问题
-                    follow_redirects=True
-                ) as client:
-                    response = client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        **kwargs
-                    )
+                    **kwargs
+                )
+                # 条件请求（If-None-Match等）命中时返回304，交由调用方复用本地缓存
+                if response.status_code != 304:
                     response.raise_for_status()
 
-                    # 请求成功，休眠避免被封
-                    if self.config.sleep_between_requests > 0:
-                        time.sleep(self.config.sleep_between_requests)
+                # 请求成功，休眠避免被封
+                if self.config.sleep_between_requests > 0:
+                    time.sleep(self.config.sleep_between_requests)
 
-                    return response
+                return response
 
             except httpx.HTTPStatusError as e:
                 self.logger.warning(
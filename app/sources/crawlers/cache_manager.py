@@ -8,20 +8,39 @@ import hashlib
 import os
 import time
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterator
 from datetime import datetime, timedelta
 import logging
 
+try:
+    import orjson
+except ImportError:  # 可选依赖：未安装时回退到标准库json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """序列化缓存数据为UTF-8字节（优先使用orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """反序列化缓存文件内容（优先使用orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class CacheManager:
     """
     爬虫缓存管理器
 
     特性：
     - 基于文件的缓存存储
-    - TTL (Time To Live) 过期机制
+    - TTL (Time To Live) 过期机制（过期时间同时记录为文件的mtime，统计和清理只需stat）
     - 自动清理过期缓存
     - 线程安全（文件锁）
     """
@@ -71,8 +90,7 @@ class CacheManager:
             return default
 
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = _loads(cache_file.read_bytes())
 
             # 检查是否过期
             expires_at = cache_data.get('expires_at')
@@ -100,7 +118,7 @@ class CacheManager:
 
         Args:
             key: 缓存键
-            value: 要缓存的数据（必须可JSON序列化）
+            value: 要缓存的数据（必须可JSON序列化，其他类型按str()保存）
             ttl: 缓存有效期（秒），None则使用默认值
 
         Returns:
@@ -119,8 +137,9 @@ class CacheManager:
         cache_file = self._get_cache_file(key)
 
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2, default=str)
+            cache_file.write_bytes(_dumps(cache_data))
+            # 将过期时间写入文件mtime，清理/统计时无需打开文件解析
+            os.utime(cache_file, (expires_at, expires_at))
 
             logger.debug(f"Cache set: {key} (ttl={ttl}s)")
             return True
@@ -180,18 +199,15 @@ class CacheManager:
         count = 0
         current_time = time.time()
 
-        for cache_file in self.cache_dir.glob("*.json"):
+        for entry in self._scan_cache_files():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-
-                expires_at = cache_data.get('expires_at')
-                if expires_at and current_time > expires_at:
-                    cache_file.unlink()
+                # mtime即过期时间（见set）
+                if current_time > entry.stat().st_mtime:
+                    os.unlink(entry.path)
                     count += 1
 
-            except Exception as e:
-                logger.warning(f"Failed to check/delete cache file {cache_file}: {e}")
+            except OSError as e:
+                logger.warning(f"Failed to check/delete cache file {entry.path}: {e}")
 
         if count > 0:
             logger.info(f"Cleaned up {count} expired cache files")
@@ -210,20 +226,18 @@ class CacheManager:
         expired_count = 0
         current_time = time.time()
 
-        for cache_file in self.cache_dir.glob("*.json"):
-            total_files += 1
-            total_size += cache_file.stat().st_size
-
+        for entry in self._scan_cache_files():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
+                stat = entry.stat()
+            except OSError:
+                continue
 
-                expires_at = cache_data.get('expires_at')
-                if expires_at and current_time > expires_at:
-                    expired_count += 1
+            total_files += 1
+            total_size += stat.st_size
 
-            except Exception:
-                pass
+            # mtime即过期时间（见set）
+            if current_time > stat.st_mtime:
+                expired_count += 1
 
         return {
             'cache_dir': str(self.cache_dir),
@@ -233,6 +247,18 @@ class CacheManager:
             'active_files': total_files - expired_count
         }
 
+    def _scan_cache_files(self) -> Iterator[os.DirEntry]:
+        """
+        遍历缓存目录中的缓存文件
+
+        Returns:
+            Iterator[os.DirEntry]: 缓存文件条目（stat结果由scandir缓存）
+        """
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    yield entry
+
     def _get_cache_file(self, key: str) -> Path:
         """
         根据key生成缓存文件路径
@@ -13,6 +13,10 @@ from app.sources.crawlers.models import RawItem, CrawlerResult
 import logging
 logger = logging.getLogger(__name__)
 
+# 预编译的正则：中文数字格式（1.2万, 3.4千）及纯数字
+CSDN_NUMBER_RE = re.compile(r'([\d.]+)\s*([万千]?)')
+DIGITS_RE = re.compile(r'\d+')
+
 
 class CSDNCrawler(BaseCrawler):
     """CSDN爬虫"""
@@ -149,17 +153,18 @@ class CSDNCrawler(BaseCrawler):
             if not response:
                 return items
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
 
             # CSDN搜索结果的HTML结构（可能会变化，需要根据实际情况调整）
             # 这里提供一个通用的解析逻辑
-            article_items = soup.find_all('div', class_='search-list-item')
+            # 每个关键词最多取8篇，找够即停止遍历文档
+            article_items = soup.find_all('div', class_='search-list-item', limit=8)
 
             if not article_items:
                 # 尝试另一种选择器
-                article_items = soup.find_all('div', class_='search-item')
+                article_items = soup.find_all('div', class_='search-item', limit=8)
 
-            for article in article_items[:8]:  # 每个关键词最多取8篇
+            for article in article_items:
                 try:
                     # 提取标题和链接
                     title_elem = article.find('a', class_='search-title') or article.find('h3')
@@ -246,10 +251,10 @@ class CSDNCrawler(BaseCrawler):
         text = text.strip().replace(',', '')
 
         # 匹配中文数字格式：1.2万, 3.4千
-        match = re.search(r'([\d.]+)\s*([万千]?)', text)
+        match = CSDN_NUMBER_RE.search(text)
         if not match:
             # 尝试直接提取数字
-            num_match = re.search(r'\d+', text)
+            num_match = DIGITS_RE.search(text)
             if num_match:
                 return int(num_match.group())
             return 0
@@ -3,16 +3,47 @@ GitHub爬虫 / GitHub Crawler
 
 抓取GitHub trending和搜索结果，获取热门项目和技术趋势
 """
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional, Tuple
+from itertools import islice
 import re
 import time
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from app.sources.crawlers.base_crawler import BaseCrawler
 from app.sources.crawlers.models import RawItem, CrawlerResult
 
 import logging
 logger = logging.getLogger(__name__)
 
+# 预编译的XPath（按单个类名匹配class属性）
+SEARCH_REPO_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' Box-sc ')]"
+)
+SEARCH_LINK_XPATH = etree.XPath(
+    ".//a[contains(concat(' ', normalize-space(@class), ' '), ' v-align-middle ')]"
+)
+SEARCH_DESC_XPATH = etree.XPath(
+    ".//p[contains(concat(' ', normalize-space(@class), ' '), ' mb-1 ')]"
+)
+STAR_LINK_XPATH = etree.XPath(".//a[contains(@href, '/stargazers')]")
+
+# Trending页面流式解析：每次向解析器喂入的字符数
+TRENDING_FEED_CHUNK = 16 * 1024
+
+# 预编译的正则
+STARGAZERS_HREF_RE = re.compile(r'/stargazers$')
+GITHUB_NUMBER_RE = re.compile(r'([\d.]+)([kKmM]?)')
+GITHUB_NUMBER_MULTIPLIERS = {'': 1, 'k': 1000, 'K': 1000, 'm': 1000000, 'M': 1000000}
+
+# Trending页面的条件请求缓存（ETag/Last-Modified + 解析后的条目）
+TRENDING_URL = "https://github.com/trending?since=daily"
+TRENDING_VALIDATOR_CACHE_KEY = "github:trending:validators"
+TRENDING_VALIDATOR_TTL = 24 * 3600
+
+
+def _element_text(element: etree._Element) -> str:
+    """拼接元素内各段文本并去除首尾空白（同BeautifulSoup的get_text(strip=True)）"""
+    return ''.join(text.strip() for text in element.itertext())
+
 
 class GitHubCrawler(BaseCrawler):
     """GitHub爬虫"""
@@ -141,26 +172,33 @@ class GitHubCrawler(BaseCrawler):
 
         try:
             # GitHub Trending URL (不使用语言过滤，获取所有trending)
-            url = "https://github.com/trending?since=daily"
-
-            response = self._make_request(url)
+            # 带上次响应的ETag/Last-Modified发起条件请求，页面未变时服务端返回304
+            cached = self.cache_manager.get(TRENDING_VALIDATOR_CACHE_KEY) if self.cache_manager else None
+            headers = {}
+            if cached and cached.get('items'):
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+            response = self._make_request(TRENDING_URL, headers=headers)
             if not response:
                 return items
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 查找trending repositories
-            repo_articles = soup.find_all('article', class_='Box-row')
+            # 未修改：直接复用上次解析的条目，跳过下载和HTML解析
+            if response.status_code == 304 and cached:
+                self.logger.info("GitHub trending not modified, reusing cached items")
+                return [RawItem(**data) for data in cached.get('items', [])]
 
-            for article in repo_articles[:10]:  # 最多取10个
+            # 流式解析，逐个处理trending条目，取够后不再解析页面剩余部分
+            articles = self._iter_trending_articles(response.text)
+            for article in islice(articles, 10):  # 最多取10个
                 try:
-                    # 提取repo名称和URL
-                    h2 = article.find('h2', class_='h3')
-                    if not h2:
-                        continue
+                    # 一次遍历定位所需节点
+                    link, desc_p, star_link, lang_color = self._scan_trending_article(article)
 
-                    link = h2.find('a')
-                    if not link:
+                    # 提取repo名称和URL
+                    if link is None:
                         continue
 
                     repo_path = link.get('href', '').strip()
@@ -168,24 +206,20 @@ class GitHubCrawler(BaseCrawler):
                     repo_name = repo_path.strip('/')
 
                     # 提取描述
-                    desc_p = article.find('p', class_='col-9')
-                    description = desc_p.get_text(strip=True) if desc_p else ""
+                    description = _element_text(desc_p) if desc_p is not None else ""
 
                     # 提取star数 - 在stargazers链接中
-                    star_link = article.find('a', href=lambda x: x and '/stargazers' in x)
-                    star_text = star_link.get_text(strip=True) if star_link else "0"
+                    star_text = _element_text(star_link) if star_link is not None else "0"
                     star_count = self._parse_github_number(star_text)
 
                     # 提取语言 - 在repo-language-color之后的文本
-                    lang_color = article.find('span', class_='repo-language-color')
                     language_name = "Unknown"
-                    if lang_color and lang_color.next_sibling:
-                        # 语言名通常紧随颜色点之后
-                        lang_text = lang_color.next_sibling
-                        if isinstance(lang_text, str):
-                            language_name = lang_text.strip()
-                        elif hasattr(lang_text, 'get_text'):
-                            language_name = lang_text.get_text(strip=True)
+                    if lang_color is not None:
+                        # 语言名通常紧随颜色点之后（尾随文本或下一个兄弟节点）
+                        if lang_color.tail:
+                            language_name = lang_color.tail.strip()
+                        elif lang_color.getnext() is not None:
+                            language_name = _element_text(lang_color.getnext())
 
                     # 提取标签
                     tags = self._extract_keywords_from_text(f"{repo_name} {description}")
@@ -207,11 +241,99 @@ class GitHubCrawler(BaseCrawler):
                     self.logger.warning(f"Failed to parse trending repo: {e}")
                     continue
 
+            # 保存校验信息和解析结果，供下次条件请求使用；
+            # 未解析出条目时不保存（如页面结构变化），否则之后的304会持续返回空列表
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if self.cache_manager and items and (etag or last_modified):
+                self.cache_manager.set(
+                    TRENDING_VALIDATOR_CACHE_KEY,
+                    {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'items': [item.model_dump() for item in items]
+                    },
+                    ttl=TRENDING_VALIDATOR_TTL
+                )
+
         except Exception as e:
             self.logger.error(f"Failed to crawl GitHub trending: {e}")
 
         return items
 
+    def _iter_trending_articles(self, html: str) -> Iterator[etree._Element]:
+        """
+        流式解析trending页面，逐个产出 article.Box-row 节点
+
+        分块喂给lxml的增量解析器，每个条目处理完即释放，内存中只保留当前条目；
+        调用方提前结束迭代时，页面剩余部分不再解析
+
+        Args:
+            html: 页面HTML
+
+        Yields:
+            article.Box-row 节点（lxml元素）
+        """
+        if not html:
+            return
+
+        parser = etree.HTMLPullParser(events=('end',), tag='article')
+
+        for start in range(0, len(html), TRENDING_FEED_CHUNK):
+            parser.feed(html[start:start + TRENDING_FEED_CHUNK])
+            yield from self._drain_trending_articles(parser)
+
+        parser.close()
+        yield from self._drain_trending_articles(parser)
+
+    @staticmethod
+    def _drain_trending_articles(parser: etree.HTMLPullParser) -> Iterator[etree._Element]:
+        """产出解析器已解析完成的 article.Box-row 节点，处理后释放"""
+        for _, article in parser.read_events():
+            if 'Box-row' in (article.get('class') or '').split():
+                yield article
+
+            # 释放已处理的条目及其之前的兄弟节点
+            article.clear(keep_tail=True)
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+
+    def _scan_trending_article(self, article: etree._Element) -> Tuple[Optional[etree._Element], ...]:
+        """
+        单次遍历trending条目，定位解析所需的节点
+
+        代替对同一子树的多次查找，找齐后提前结束遍历
+
+        Args:
+            article: article.Box-row节点
+
+        Returns:
+            (仓库链接, 描述段落, stargazers链接, 语言颜色点)，未找到的为None
+        """
+        link = desc_p = star_link = lang_color = None
+        seen_h2 = False
+
+        for tag in article.iterdescendants():
+            name = tag.tag
+            if not isinstance(name, str):  # 跳过注释等非元素节点
+                continue
+            classes = (tag.get('class') or '').split()
+
+            if name == 'h2' and not seen_h2 and 'h3' in classes:
+                seen_h2 = True
+                link = next(tag.iterdescendants('a'), None)
+            elif name == 'p' and desc_p is None and 'col-9' in classes:
+                desc_p = tag
+            elif name == 'a' and star_link is None and '/stargazers' in tag.get('href', ''):
+                star_link = tag
+            elif name == 'span' and lang_color is None and 'repo-language-color' in classes:
+                lang_color = tag
+
+            if seen_h2 and desc_p is not None and star_link is not None and lang_color is not None:
+                break
+
+        return link, desc_p, star_link, lang_color
+
     def _crawl_search(self, keywords: List[str]) -> List[RawItem]:
         """
         抓取GitHub搜索结果
@@ -233,19 +355,19 @@ class GitHubCrawler(BaseCrawler):
                 if not response:
                     continue
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                root = lxml_html.fromstring(response.text)
 
                 # 查找搜索结果
-                repo_items = soup.find_all('div', class_='Box-sc')
+                repo_items = SEARCH_REPO_XPATH(root)
 
                 for repo_div in repo_items[:5]:  # 每个关键词最多取5个
                     try:
                         # 查找repo链接
-                        link = repo_div.find('a', class_='v-align-middle')
-                        if not link:
+                        links = SEARCH_LINK_XPATH(repo_div)
+                        if not links:
                             continue
 
-                        repo_path = link.get('href', '').strip()
+                        repo_path = links[0].get('href', '').strip()
                         if not repo_path.startswith('/'):
                             continue
 
@@ -253,14 +375,18 @@ class GitHubCrawler(BaseCrawler):
                         repo_name = repo_path.strip('/')
 
                         # 提取描述
-                        desc_elem = repo_div.find('p', class_='mb-1')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ""
+                        desc_elems = SEARCH_DESC_XPATH(repo_div)
+                        description = _element_text(desc_elems[0]) if desc_elems else ""
 
                         # 提取star数（搜索结果页面格式可能不同）
                         star_count = 0
-                        star_link = repo_div.find('a', href=re.compile(r'/stargazers$'))
-                        if star_link:
-                            star_text = star_link.get_text(strip=True)
+                        star_link = next(
+                            (a for a in STAR_LINK_XPATH(repo_div)
+                             if STARGAZERS_HREF_RE.search(a.get('href', ''))),
+                            None
+                        )
+                        if star_link is not None:
+                            star_text = _element_text(star_link)
                             star_count = self._parse_github_number(star_text)
 
                         # 提取标签
@@ -299,19 +425,9 @@ class GitHubCrawler(BaseCrawler):
         Returns:
             整数值
         """
-        text = text.strip().replace(',', '')
-
-        # 匹配 1.2k, 3.4m 等格式
-        match = re.search(r'([\d.]+)([km]?)', text.lower())
+        # 匹配 1.2k, 3.4m 等格式，单位按倍数表换算
+        match = GITHUB_NUMBER_RE.search(text.replace(',', ''))
         if not match:
             return 0
 
-        number = float(match.group(1))
-        unit = match.group(2)
-
-        if unit == 'k':
-            return int(number * 1000)
-        elif unit == 'm':
-            return int(number * 1000000)
-        else:
-            return int(number)
+        return int(float(match.group(1)) * GITHUB_NUMBER_MULTIPLIERS[match.group(2)])
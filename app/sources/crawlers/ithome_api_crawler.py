@@ -6,18 +6,16 @@ API来源: https://newsnow.busiyi.world/api/s (TrendRadar项目使用的聚合AP
 """
 from typing import List, Dict, Optional
 import logging
-import requests
 import time
-import random
 
-from app.sources.crawlers.base_crawler import BaseCrawler
+from app.sources.crawlers.newsnow_crawler import NewsnowAPICrawler
 from app.sources.crawlers.models import RawItem, CrawlerResult
 
 
 logger = logging.getLogger(__name__)
 
 
-class ITHomeAPICrawler(BaseCrawler):
+class ITHomeAPICrawler(NewsnowAPICrawler):
     """IT之家爬虫 - 使用newsnow API获取科技新闻"""
 
     # 技术关键词映射 (用于筛选IT之家新闻)
@@ -85,13 +83,20 @@ class ITHomeAPICrawler(BaseCrawler):
         self.logger = logging.getLogger("ITHomeAPICrawler")
         self.api_url = "https://newsnow.busiyi.world/api/s?id=ithome&latest"
 
-    def crawl(self, domain: str, keywords: List[str]) -> CrawlerResult:
+    def crawl(
+        self,
+        domain: str,
+        keywords: List[str],
+        raw: Optional[List[Dict]] = None
+    ) -> CrawlerResult:
         """
         通过newsnow API爬取IT之家科技新闻
 
         Args:
             domain: 目标领域（如 "backend", "llm_application"）
             keywords: 关键词列表（用于搜索，IT之家不使用但需要保持接口一致）
+            raw: 已获取的原始API数据（见fetch_raw），传入时不再请求API，
+                 便于多个领域共用一次抓取
 
         Returns:
             CrawlerResult: 爬取结果
@@ -100,8 +105,8 @@ class ITHomeAPICrawler(BaseCrawler):
         self.logger.info(f"开始通过API获取IT之家数据 (domain={domain})")
 
         try:
-            # 调用 newsnow API
-            items = self._fetch_from_api()
+            # 调用 newsnow API（已传入原始数据时直接复用，否则走短时缓存）
+            items = raw if raw is not None else self.fetch_raw()
 
             # 筛选技术相关内容
             filtered_items = self._filter_tech_items(items, domain)
@@ -133,56 +138,6 @@ class ITHomeAPICrawler(BaseCrawler):
                 duration_ms=elapsed_ms
             )
 
-    def _fetch_from_api(self) -> List[Dict]:
-        """
-        从newsnow API获取IT之家数据
-
-        Returns:
-            List[Dict]: API返回的原始数据列表
-        """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Connection": "keep-alive",
-            "Cache-Control": "no-cache",
-        }
-
-        # 带重试的请求
-        max_retries = 3
-        for retry in range(max_retries):
-            try:
-                response = requests.get(
-                    self.api_url,
-                    headers=headers,
-                    timeout=10
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                status = data.get("status", "unknown")
-
-                if status not in ["success", "cache"]:
-                    raise ValueError(f"API状态异常: {status}")
-
-                status_info = "最新数据" if status == "success" else "缓存数据"
-                self.logger.info(f"API请求成功 ({status_info})")
-
-                return data.get("items", [])
-
-            except Exception as e:
-                if retry < max_retries - 1:
-                    wait_time = (retry + 1) * 2 + random.uniform(0, 1)
-                    self.logger.warning(
-                        f"API请求失败 (重试 {retry + 1}/{max_retries}): {e}. "
-                        f"{wait_time:.1f}秒后重试..."
-                    )
-                    time.sleep(wait_time)
-                else:
-                    raise
-
-        return []
-
     def _filter_tech_items(
         self,
         items: List[Dict],
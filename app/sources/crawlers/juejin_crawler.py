@@ -144,11 +144,11 @@ class JuejinCrawler(BaseCrawler):
             if not response:
                 return items
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
 
             # 掘金文章卡片
             # 注意：这里的选择器需要根据实际页面结构调整
-            article_cards = soup.find_all('div', class_='result-item')[:10]
+            article_cards = soup.find_all('div', class_='result-item', limit=10)
 
             for card in article_cards:
                 try:
@@ -177,8 +177,8 @@ class JuejinCrawler(BaseCrawler):
 
                     # 提取标签
                     tags = [keyword]
-                    tag_elems = card.find_all('a', class_='tag')
-                    for tag_elem in tag_elems[:3]:
+                    tag_elems = card.find_all('a', class_='tag', limit=3)
+                    for tag_elem in tag_elems:
                         tag = tag_elem.get_text(strip=True)
                         if tag:
                             tags.append(tag)
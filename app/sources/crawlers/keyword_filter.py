@@ -6,7 +6,10 @@ TrendRadar风格的关键词过滤语法：
 - +required_word: 必须包含的关键词
 - !exclude_word: 必须排除的关键词
 """
-from typing import List, Set, Tuple
+from typing import Collection, FrozenSet, List, Optional, Set, Tuple
+from functools import lru_cache
+from operator import itemgetter
+import heapq
 import re
 
 
@@ -19,6 +22,8 @@ class KeywordFilter:
     - "+必须" - 必须包含
     - "!排除" - 必须不包含
 
+    关键词集合在初始化后冻结（frozenset），实例不可变，可被多处安全复用
+
     示例:
         filter = KeywordFilter(["Python", "+后端", "!前端"])
         filter.matches("Python后端开发工程师")  # True (有Python, 有后端)
@@ -33,9 +38,9 @@ class KeywordFilter:
         Args:
             keywords: 关键词列表，支持 +required 和 !exclude 前缀
         """
-        self.normal_keywords: Set[str] = set()
-        self.required_keywords: Set[str] = set()
-        self.exclude_keywords: Set[str] = set()
+        normal_keywords: Set[str] = set()
+        required_keywords: Set[str] = set()
+        exclude_keywords: Set[str] = set()
 
         # 解析关键词
         for keyword in keywords:
@@ -46,13 +51,28 @@ class KeywordFilter:
 
             if keyword.startswith('+'):
                 # 必须包含的关键词
-                self.required_keywords.add(keyword[1:].strip())
+                required_keywords.add(keyword[1:].strip())
             elif keyword.startswith('!'):
                 # 必须排除的关键词
-                self.exclude_keywords.add(keyword[1:].strip())
+                exclude_keywords.add(keyword[1:].strip())
             else:
                 # 普通关键词
-                self.normal_keywords.add(keyword)
+                normal_keywords.add(keyword)
+
+        self.normal_keywords: FrozenSet[str] = frozenset(normal_keywords)
+        self.required_keywords: FrozenSet[str] = frozenset(required_keywords)
+        self.exclude_keywords: FrozenSet[str] = frozenset(exclude_keywords)
+
+        # 预先转换为小写元组，匹配时文本只需转换一次大小写
+        self._normal_lc: Tuple[str, ...] = tuple(kw.lower() for kw in self.normal_keywords)
+        self._required_lc: Tuple[str, ...] = tuple(kw.lower() for kw in self.required_keywords)
+        self._exclude_lc: Tuple[str, ...] = tuple(kw.lower() for kw in self.exclude_keywords)
+
+    def _keyword_groups(self, case_sensitive: bool) -> Tuple[Collection[str], ...]:
+        """返回 (必须, 排除, 普通) 三组关键词，按是否区分大小写选取"""
+        if case_sensitive:
+            return self.required_keywords, self.exclude_keywords, self.normal_keywords
+        return self._required_lc, self._exclude_lc, self._normal_lc
 
     def matches(self, text: str, case_sensitive: bool = False) -> bool:
         """
@@ -68,25 +88,20 @@ class KeywordFilter:
         if not text:
             return False
 
-        # 转换大小写
+        # 转换大小写（仅一次）
         if not case_sensitive:
             text = text.lower()
 
-        # 1. 检查排除关键词（任意一个存在就排除）
-        for exclude_kw in self.exclude_keywords:
-            check_kw = exclude_kw if case_sensitive else exclude_kw.lower()
-            if check_kw in text:
-                return False
+        required, exclude, _ = self._keyword_groups(case_sensitive)
 
+        # 1. 检查排除关键词（任意一个存在就排除）
         # 2. 检查必须包含的关键词（全部都要存在）
-        for required_kw in self.required_keywords:
-            check_kw = required_kw if case_sensitive else required_kw.lower()
-            if check_kw not in text:
-                return False
-
-        # 3. 通过了排除和必须关键词的检查，就匹配
+        # 通过了排除和必须关键词的检查，就匹配
         # 注意：普通关键词只影响分数，不影响是否匹配
-        return True
+        return (
+            not any(kw in text for kw in exclude) and
+            all(kw in text for kw in required)
+        )
 
     def calculate_score(self, text: str, case_sensitive: bool = False) -> float:
         """
@@ -99,39 +114,57 @@ class KeywordFilter:
         Returns:
             float: 相关性分数（0-100），不匹配返回0
         """
-        if not self.matches(text, case_sensitive):
-            return 0.0
+        return self.match_and_score(text, case_sensitive)[1]
+
+    def match_and_score(self, text: str, case_sensitive: bool = False) -> Tuple[bool, float]:
+        """
+        一次扫描同时判断是否匹配并计算分数
 
-        score = 0.0
+        需要同时得到匹配结果和分数时，代替先调用matches再调用calculate_score
 
-        # 转换大小写
+        Args:
+            text: 待检测的文本
+            case_sensitive: 是否区分大小写（默认不区分）
+
+        Returns:
+            Tuple[bool, float]: (是否匹配, 相关性分数)，不匹配时分数为0
+        """
+        if not text:
+            return False, 0.0
+
+        # 转换大小写（仅一次，匹配和评分共用）
         if not case_sensitive:
             text = text.lower()
 
-        # 必须关键词: 每个 +20 分
-        for required_kw in self.required_keywords:
-            check_kw = required_kw if case_sensitive else required_kw.lower()
-            if check_kw in text:
-                score += 20.0
+        required, exclude, normal = self._keyword_groups(case_sensitive)
+
+        # 排除词命中或缺少必须词，不匹配
+        for kw in exclude:
+            if kw in text:
+                return False, 0.0
+        for kw in required:
+            if kw not in text:
+                return False, 0.0
+
+        # 必须关键词全部命中: 每个 +20 分
+        score = 20.0 * len(required)
 
         # 普通关键词: 每个 +10 分
-        for normal_kw in self.normal_keywords:
-            check_kw = normal_kw if case_sensitive else normal_kw.lower()
-            if check_kw in text:
-                score += 10.0
+        score += 10.0 * sum(1 for kw in normal if kw in text)
 
         # 基础分
         score += 10.0
 
         # 最高100分
-        return min(score, 100.0)
+        return True, min(score, 100.0)
 
     def filter_items(
         self,
         items: List[dict],
         text_field: str = 'title',
         score_field: str = 'relevance_score',
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        top_k: Optional[int] = None
     ) -> List[dict]:
         """
         过滤并评分数据项
@@ -141,11 +174,13 @@ class KeywordFilter:
             text_field: 用于匹配的文本字段名（默认 'title'）
             score_field: 添加分数的字段名（默认 'relevance_score'）
             min_score: 最低分数阈值（默认0，即只要匹配就保留）
+            top_k: 只返回分数最高的前K项（默认None，返回全部）
 
         Returns:
             List[dict]: 过滤并评分后的数据项（按分数降序排列）
         """
-        filtered = []
+        scored = []
+        calculate_score = self.calculate_score  # 绑定到局部变量，避免循环内属性查找
 
         for item in items:
             # 获取文本
@@ -154,16 +189,24 @@ class KeywordFilter:
                 continue
 
             # 计算分数
-            score = self.calculate_score(text)
+            score = calculate_score(text)
 
             if score > min_score:
-                # 创建副本并添加分数
-                item_copy = item.copy()
-                item_copy[score_field] = score
-                filtered.append(item_copy)
+                scored.append((score, item))
 
-        # 按分数降序排列
-        filtered.sort(key=lambda x: x.get(score_field, 0), reverse=True)
+        # 按分数降序排列（只需前K项时用堆选择，O(n log k)）
+        by_score = itemgetter(0)
+        if top_k is not None:
+            scored = heapq.nlargest(top_k, scored, key=by_score)
+        else:
+            scored.sort(key=by_score, reverse=True)
+
+        # 只为保留下来的项创建副本并添加分数
+        filtered = []
+        for score, item in scored:
+            item_copy = item.copy()
+            item_copy[score_field] = score
+            filtered.append(item_copy)
 
         return filtered
 
@@ -229,10 +272,13 @@ def create_filter(keywords: List[str]) -> KeywordFilter:
     return KeywordFilter(keywords)
 
 
+@lru_cache(maxsize=256)
 def create_filter_from_string(keyword_string: str) -> KeywordFilter:
     """
     从字符串创建关键词过滤器
 
+    结果按字符串缓存：同一过滤字符串只解析一次，返回共享的（不可变）实例
+
     Args:
         keyword_string: 关键词字符串
 
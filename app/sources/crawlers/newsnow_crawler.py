@@ -0,0 +1,100 @@
+"""
+newsnow API 爬虫基类 / Newsnow API Crawler Base
+
+V2EX、IT之家等通过 newsnow 聚合API获取数据的爬虫共用的抓取与缓存逻辑
+API来源: https://newsnow.busiyi.world/api/s (TrendRadar项目使用的聚合API)
+"""
+from typing import List, Dict
+import time
+import random
+
+from app.sources.crawlers.base_crawler import BaseCrawler, get_http_client, loads_json
+
+
+# 原始API数据的缓存时间（多个领域共用同一份上游数据）
+RAW_CACHE_TTL = 300
+
+NEWSNOW_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+    "Cache-Control": "no-cache",
+}
+
+
+class NewsnowAPICrawler(BaseCrawler):
+    """
+    newsnow API 爬虫基类
+
+    子类需设置 self.api_url 并实现 crawl / source_name
+    """
+
+    api_url: str
+
+    def fetch_raw(self) -> List[Dict]:
+        """
+        获取原始API数据（短时缓存，缓存键为 "<source_name>:raw"）
+
+        上游数据与领域无关，按领域多次调用crawl时先取一次，再通过raw参数传入
+
+        Returns:
+            List[Dict]: API返回的原始数据列表
+        """
+        cache_key = f"{self.source_name}:raw"
+
+        if self.cache_manager:
+            cached = self.cache_manager.get(cache_key)
+            if cached is not None:
+                return cached
+
+        items = self._fetch_from_api()
+
+        if self.cache_manager:
+            self.cache_manager.set(cache_key, items, ttl=RAW_CACHE_TTL)
+
+        return items
+
+    def _fetch_from_api(self) -> List[Dict]:
+        """
+        从newsnow API获取数据
+
+        Returns:
+            List[Dict]: API返回的原始数据列表
+        """
+        # 带重试的请求（使用共享HTTP客户端，多次调用复用keep-alive连接；
+        # 外部JSON API需校验TLS证书）
+        client = get_http_client(verify=True)
+        max_retries = 3
+        for retry in range(max_retries):
+            try:
+                response = client.get(
+                    self.api_url,
+                    headers=NEWSNOW_HEADERS,
+                    timeout=10
+                )
+                response.raise_for_status()
+
+                data = loads_json(response.content)
+                status = data.get("status", "unknown")
+
+                if status not in ["success", "cache"]:
+                    raise ValueError(f"API状态异常: {status}")
+
+                status_info = "最新数据" if status == "success" else "缓存数据"
+                self.logger.info(f"API请求成功 ({status_info})")
+
+                return data.get("items", [])
+
+            except Exception as e:
+                if retry < max_retries - 1:
+                    wait_time = (retry + 1) * 2 + random.uniform(0, 1)
+                    self.logger.warning(
+                        f"API请求失败 (重试 {retry + 1}/{max_retries}): {e}. "
+                        f"{wait_time:.1f}秒后重试..."
+                    )
+                    time.sleep(wait_time)
+                else:
+                    raise
+
+        return []
@@ -10,10 +10,11 @@
 - 质量过滤
 """
 from typing import List, Dict, Tuple
-from collections import Counter
+from collections import Counter, defaultdict
 import re
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
+from urllib.parse import urlsplit
 
 from app.sources.crawlers.models import RawItem
 from app.models.external_info import (
@@ -25,6 +26,9 @@ from app.models.external_info import (
 import logging
 logger = logging.getLogger(__name__)
 
+# 含问号的句子（句子以 。！或换行 分隔；后行断言保证从句首开始匹配）
+QUESTION_SENTENCE_RE = re.compile(r'(?:^|(?<=[。！\n]))[^。！\n]*[？?][^。！\n]*')
+
 
 class TrendAggregator:
     """趋势聚合器 V2 - 优化版"""
@@ -48,6 +52,9 @@ class TrendAggregator:
         'interview': 1.3,  # 面试经验
     }
 
+    # 关键词聚合时忽略的通用词
+    GENERIC_KEYWORDS = frozenset({'技术', '开发', '系统'})
+
     @staticmethod
     def aggregate(
         raw_items: List[RawItem],
@@ -82,11 +89,15 @@ class TrendAggregator:
         # 3. 按质量分数排序
         unique_items.sort(key=lambda x: x.metadata.get('quality_score', 0), reverse=True)
 
-        # 4. 分组：技术项目 vs 讨论 vs 新闻 vs 文章
-        github_items = [item for item in unique_items if item.source == 'github']
-        v2ex_items = [item for item in unique_items if item.source == 'v2ex']
-        ithome_items = [item for item in unique_items if item.source == 'ithome']
-        csdn_items = [item for item in unique_items if item.source == 'csdn']
+        # 4. 分组：技术项目 vs 讨论 vs 新闻 vs 文章（一次遍历按来源分组，组内保持质量排序）
+        items_by_source: Dict[str, List[RawItem]] = defaultdict(list)
+        for item in unique_items:
+            items_by_source[item.source].append(item)
+
+        github_items = items_by_source['github']
+        v2ex_items = items_by_source['v2ex']
+        ithome_items = items_by_source['ithome']
+        csdn_items = items_by_source['csdn']
 
         # 5. 转换为JD和面经
         # JD来源：GitHub项目 + V2EX讨论 + IT之家新闻 + CSDN文章
@@ -166,30 +177,44 @@ class TrendAggregator:
             去重后的数据项列表
         """
         seen_urls = set()
-        seen_titles = []
+        # 每个已保留标题一个匹配器：标题作为seq2，其索引只构建一次
+        seen_title_matchers: List[SequenceMatcher] = []
         unique = []
 
         for item in items:
-            # 1. URL精确去重
-            if item.url in seen_urls:
+            # 1. URL去重（规范化后比较，跨数据源的同一链接只保留一次）
+            url_key = TrendAggregator._url_key(item.url)
+            if url_key in seen_urls:
                 continue
 
             # 2. 标题相似度去重
+            title = item.title.lower()
             is_duplicate = False
-            for prev_title in seen_titles:
-                similarity = SequenceMatcher(None, item.title.lower(), prev_title.lower()).ratio()
+            for matcher in seen_title_matchers:
+                matcher.set_seq1(title)
+                # quick_ratio系列是ratio的上界，低于阈值时无需精确计算
+                if (matcher.real_quick_ratio() < similarity_threshold
+                        or matcher.quick_ratio() < similarity_threshold):
+                    continue
+                similarity = matcher.ratio()
                 if similarity >= similarity_threshold:
                     is_duplicate = True
-                    logger.debug(f"Duplicate title detected (similarity={similarity:.2f}): {item.title}")
+                    logger.debug("Duplicate title detected (similarity=%.2f): %s", similarity, item.title)
                     break
 
             if not is_duplicate:
-                seen_urls.add(item.url)
-                seen_titles.append(item.title)
+                seen_urls.add(url_key)
+                seen_title_matchers.append(SequenceMatcher(None, "", title))
                 unique.append(item)
 
         return unique
 
+    @staticmethod
+    def _url_key(url: str) -> Tuple[str, str, str]:
+        """URL去重键：忽略协议、主机名大小写、末尾斜杠和锚点"""
+        parts = urlsplit(url)
+        return parts.netloc.lower(), parts.path.rstrip('/'), parts.query
+
     @staticmethod
     def _calculate_quality_score(item: RawItem) -> float:
         """
@@ -311,7 +336,7 @@ class TrendAggregator:
                     break
 
             except Exception as e:
-                logger.warning(f"Failed to convert item to JD: {e}")
+                logger.warning("Failed to convert item to JD: %s", e)
                 continue
 
         return jds
@@ -377,7 +402,7 @@ class TrendAggregator:
                 experiences.append(exp)
 
             except Exception as e:
-                logger.warning(f"Failed to convert item to experience: {e}")
+                logger.warning("Failed to convert item to experience: %s", e)
                 continue
 
         return experiences
@@ -385,24 +410,16 @@ class TrendAggregator:
     @staticmethod
     def _extract_keywords(items: List[RawItem], max_count: int) -> List[str]:
         """提取和聚合关键词"""
-        all_keywords = []
-
-        for item in items:
-            all_keywords.extend(item.tags)
-
-        # 计数并排序
-        keyword_counter = Counter(all_keywords)
-
-        # 过滤太短的关键词
-        filtered_keywords = [
-            (kw, count) for kw, count in keyword_counter.items()
-            if len(kw) > 1 and kw not in ['技术', '开发', '系统']
-        ]
-
-        # 按频率排序
-        top_keywords = [kw for kw, _ in sorted(filtered_keywords, key=lambda x: x[1], reverse=True)]
+        # 计数时直接过滤太短的关键词和通用词
+        keyword_counter = Counter(
+            kw
+            for item in items
+            for kw in item.tags
+            if len(kw) > 1 and kw not in TrendAggregator.GENERIC_KEYWORDS
+        )
 
-        return top_keywords[:max_count]
+        # 按频率取前max_count个（同频保持首次出现顺序）
+        return [kw for kw, _ in keyword_counter.most_common(max_count)]
 
     @staticmethod
     def _extract_topics(items: List[RawItem], max_topics: int) -> List[str]:
@@ -474,23 +491,13 @@ class TrendAggregator:
         """从文本中提取面试问题"""
         questions = []
 
-        # 匹配问题模式（带问号）
-        question_patterns = [
-            r'[？?]',  # 问号结尾
-            r'\d+[.、][\s]*(.*?[？?])',  # 编号问题
-        ]
-
-        # 按句子分割
-        sentences = re.split(r'[。！\n]', text)
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-
-            # 检查是否包含问号
-            if '？' in sentence or '?' in sentence:
-                # 清理并添加
-                cleaned = sentence.strip()
-                if 10 < len(cleaned) < 200:  # 合理长度
-                    questions.append(cleaned)
+        # 单次扫描，只取出含问号的句子（不再先切分出全部句子）
+        for match in QUESTION_SENTENCE_RE.finditer(text):
+            # 清理并添加
+            cleaned = match.group().strip()
+            if 10 < len(cleaned) < 200:  # 合理长度
+                questions.append(cleaned)
+                if len(questions) == 10:
+                    break
 
-        return questions[:10]
+        return questions
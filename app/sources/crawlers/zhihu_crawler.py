@@ -2,6 +2,7 @@
 知乎(Zhihu)爬虫 - 获取技术问答和文章
 """
 import logging
+import re
 import time
 from typing import List
 from urllib.parse import quote
@@ -13,6 +14,8 @@ from .base_crawler import BaseCrawler
 from .models import RawItem, CrawlerResult
 from .anti_detection import AntiDetectionHelper
 
+DIGITS_RE = re.compile(r'\d+')
+
 
 class ZhihuCrawler(BaseCrawler):
     """知乎爬虫 - 专注技术问答和经验分享"""
@@ -144,16 +147,16 @@ class ZhihuCrawler(BaseCrawler):
             if not response:
                 return items
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
 
             # 知乎搜索结果卡片
             # 注意：知乎可能会返回React渲染的页面，部分内容在JSON中
             # 这里尝试解析HTML结构
-            result_cards = soup.find_all('div', class_='List-item')[:10]
+            result_cards = soup.find_all('div', class_='List-item', limit=10)
 
             # 如果没找到，尝试其他选择器
             if not result_cards:
-                result_cards = soup.find_all('div', {'data-zop-feedtype': True})[:10]
+                result_cards = soup.find_all('div', {'data-zop-feedtype': True}, limit=10)
 
             for card in result_cards:
                 try:
@@ -191,8 +194,8 @@ class ZhihuCrawler(BaseCrawler):
 
                     # 提取标签
                     tags = [keyword]
-                    tag_elems = card.find_all('a', class_='TopicLink')
-                    for tag_elem in tag_elems[:3]:
+                    tag_elems = card.find_all('a', class_='TopicLink', limit=3)
+                    for tag_elem in tag_elems:
                         tag = tag_elem.get_text(strip=True)
                         if tag:
                             tags.append(tag)
@@ -233,8 +236,7 @@ class ZhihuCrawler(BaseCrawler):
                 return int(float(text.replace('k', '').replace('千', '').strip()) * 1000)
             else:
                 # 提取所有数字
-                import re
-                numbers = re.findall(r'\d+', text)
+                numbers = DIGITS_RE.findall(text)
                 return int(numbers[0]) if numbers else 0
         except:
             return 0
@@ -2,8 +2,10 @@
 
 This module provides real data from JSON files with keyword frequency analysis.
 """
+import heapq
 import json
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from collections import Counter
@@ -268,9 +270,8 @@ class JSONDataProvider:
         # Filter by minimum frequency
         filtered = {k: v for k, v in keyword_freq.items() if v >= min_frequency}
 
-        # Sort and return top K
-        sorted_keywords = sorted(filtered.items(), key=lambda x: x[1], reverse=True)
-        return sorted_keywords[:top_k]
+        # Select top K without sorting the whole table (ties keep insertion order)
+        return heapq.nlargest(top_k, filtered.items(), key=itemgetter(1))
 
     def get_trending_topics(
         self,
@@ -1,6 +1,7 @@
 """Local dataset backed provider for ExternalInfoService."""
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -96,13 +97,11 @@ class LocalDatasetProvider:
         return trends
 
     def _build_topic_trends(self, experiences) -> List[TopicTrend]:
-        topic_counter: Dict[str, int] = {}
-        for exp in experiences:
-            for topic in exp.topics:
-                topic_counter[topic] = topic_counter.get(topic, 0) + 1
-        return [TopicTrend(topic=topic, frequency=freq) for topic, freq in sorted(
-            topic_counter.items(), key=lambda item: item[1], reverse=True
-        )]
+        topic_counter = Counter(topic for exp in experiences for topic in exp.topics)
+        return [
+            TopicTrend(topic=topic, frequency=freq)
+            for topic, freq in topic_counter.most_common()
+        ]
 
     @staticmethod
     def _build_keyword_source_map(jds) -> Dict[str, List[str]]:
@@ -124,16 +123,18 @@ class LocalDatasetProvider:
 
         if self._latest_keyword_trends:
             lines.append("\n**高频技能（近30天样本）**:")
-            for trend in self._latest_keyword_trends[:8]:
-                source_hint = ", ".join(trend.sources[:3]) if trend.sources else "多家公司"
-                lines.append(
-                    f"- {trend.keyword}: {trend.frequency} 次 (来源: {source_hint})"
-                )
+            lines.extend(
+                f"- {trend.keyword}: {trend.frequency} 次 "
+                f"(来源: {', '.join(trend.sources[:3]) if trend.sources else '多家公司'})"
+                for trend in self._latest_keyword_trends[:8]
+            )
 
         if self._latest_topic_trends:
             lines.append("\n**常见面试主题**:")
-            for topic in self._latest_topic_trends[:5]:
-                lines.append(f"- {topic.topic}: {topic.frequency} 次")
+            lines.extend(
+                f"- {topic.topic}: {topic.frequency} 次"
+                for topic in self._latest_topic_trends[:5]
+            )
 
         lines.append("\n提示：优先关注高频技能，生成 support_notes 时显式标注。")
         return "\n".join(lines)
@@ -3,9 +3,12 @@
 
 TrendRadar风格的多源信息采集提供者，整合GitHub、CSDN等数据源
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from collections import OrderedDict
 import logging
 import asyncio
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from app.models.external_info import ExternalInfoSummary
@@ -22,12 +25,16 @@ from app.sources.crawlers.trend_aggregator import TrendAggregator
 
 logger = logging.getLogger(__name__)
 
+# 提供者级检索结果缓存的最大条目数
+SUMMARY_CACHE_SIZE = 64
+
 
 class MultiSourceCrawlerProvider:
     """
     多源爬虫提供者
 
-    整合多个爬虫，并行抓取，聚合结果
+    整合多个爬虫，并行抓取，聚合结果；相同检索条件的聚合结果在
+    cache_ttl内直接复用（跳过抓取、去重和评分）
     """
 
     def __init__(
@@ -55,6 +62,10 @@ class MultiSourceCrawlerProvider:
         self.config = config or CrawlerConfig()
         self.crawlers: List[BaseCrawler] = []
 
+        # 聚合结果缓存: 检索条件 -> (过期时间, ExternalInfoSummary)，按LRU淘汰
+        self._summary_cache: "OrderedDict[Tuple, Tuple[float, ExternalInfoSummary]]" = OrderedDict()
+        self._summary_cache_lock = threading.Lock()
+
         # 注册爬虫 (按推荐优先级排序)
         if enable_github:
             self.crawlers.append(GitHubCrawler(self.config))
@@ -97,55 +108,191 @@ class MultiSourceCrawlerProvider:
         Returns:
             ExternalInfoSummary 或 None
         """
+        cache_key = self._summary_cache_key(user_config, resume_keywords)
+        cached_summary = self._get_cached_summary(cache_key)
+        if cached_summary is not None:
+            logger.info(f"Using cached external info for domain '{cache_key[0]}'")
+            return cached_summary
+
         try:
-            domain = user_config.domain or 'backend'
-            keywords = resume_keywords or []
+            domain, keywords = self._build_query(user_config, resume_keywords)
 
-            # 添加目标描述中的关键词
-            if user_config.target_desc:
-                keywords.extend(self._extract_keywords_from_desc(user_config.target_desc))
+            # 并行爬取所有数据源
+            all_results = self._crawl_all_sources(domain, keywords)
 
-            # 去重
-            keywords = list(set(keywords))[:5]  # 最多5个关键词
+            summary = self._aggregate_results(domain, all_results)
+            if summary is not None:
+                self._set_cached_summary(cache_key, summary)
+            return summary
 
-            logger.info(f"Retrieving external info for domain '{domain}' with keywords: {keywords}")
+        except Exception as e:
+            logger.error(f"Failed to retrieve external info: {e}", exc_info=True)
+            return None
 
-            # 并行爬取所有数据源
-            all_results = self._crawl_all_sources(domain, keywords)
+    async def retrieve_external_info_async(
+        self,
+        user_config: UserConfig,
+        resume_keywords: Optional[List[str]] = None
+    ) -> Optional[ExternalInfoSummary]:
+        """
+        异步检索外部信息
 
-            # 合并所有RawItem
-            all_items = []
-            for result in all_results:
-                if result.success:
-                    all_items.extend(result.items)
-                    logger.info(f"Source '{result.source}': {result.crawled_count} items in {result.duration_ms}ms")
-                else:
-                    logger.warning(f"Source '{result.source}' failed: {result.error_message}")
-
-            if not all_items:
-                logger.info("No external information found")
-                return None
+        各数据源通过crawl_async并发抓取，可在事件循环中直接await；
+        也便于用asyncio.gather并发检索多个配置（如多个领域）
+
+        Args:
+            user_config: 用户配置
+            resume_keywords: 从简历中提取的关键词
+
+        Returns:
+            ExternalInfoSummary 或 None
+        """
+        cache_key = self._summary_cache_key(user_config, resume_keywords)
+        cached_summary = self._get_cached_summary(cache_key)
+        if cached_summary is not None:
+            logger.info(f"Using cached external info for domain '{cache_key[0]}'")
+            return cached_summary
 
-            # 聚合为ExternalInfoSummary
-            summary = TrendAggregator.aggregate(
-                raw_items=all_items,
-                domain=domain,
-                max_jd=5,
-                max_exp=5,
-                max_keywords=20
-            )
+        try:
+            domain, keywords = self._build_query(user_config, resume_keywords)
 
-            logger.info(
-                f"External info retrieved: {len(summary.job_descriptions)} JDs, "
-                f"{len(summary.interview_experiences)} experiences"
-            )
+            # 并发爬取所有数据源
+            all_results = await self._crawl_all_sources_async(domain, keywords)
 
+            summary = self._aggregate_results(domain, all_results)
+            if summary is not None:
+                self._set_cached_summary(cache_key, summary)
             return summary
 
         except Exception as e:
             logger.error(f"Failed to retrieve external info: {e}", exc_info=True)
             return None
 
+    def _build_query(
+        self,
+        user_config: UserConfig,
+        resume_keywords: Optional[List[str]]
+    ) -> Tuple[str, List[str]]:
+        """
+        根据用户配置确定检索领域和关键词
+
+        Args:
+            user_config: 用户配置
+            resume_keywords: 从简历中提取的关键词
+
+        Returns:
+            (领域, 关键词列表)
+        """
+        domain = user_config.domain or 'backend'
+        keywords = list(resume_keywords or [])
+
+        # 添加目标描述中的关键词
+        if user_config.target_desc:
+            keywords.extend(self._extract_keywords_from_desc(user_config.target_desc))
+
+        # 去重
+        keywords = list(set(keywords))[:5]  # 最多5个关键词
+
+        logger.info(f"Retrieving external info for domain '{domain}' with keywords: {keywords}")
+
+        return domain, keywords
+
+    def _aggregate_results(
+        self,
+        domain: str,
+        all_results: List[CrawlerResult]
+    ) -> Optional[ExternalInfoSummary]:
+        """
+        合并各数据源的抓取结果并聚合为ExternalInfoSummary
+
+        Args:
+            domain: 目标领域
+            all_results: 各数据源的CrawlerResult
+
+        Returns:
+            ExternalInfoSummary，没有任何数据时返回None
+        """
+        # 合并所有RawItem
+        all_items = []
+        for result in all_results:
+            if result.success:
+                all_items.extend(result.items)
+                logger.info("Source '%s': %s items in %sms", result.source, result.crawled_count, result.duration_ms)
+            else:
+                logger.warning("Source '%s' failed: %s", result.source, result.error_message)
+
+        if not all_items:
+            logger.info("No external information found")
+            return None
+
+        # 聚合为ExternalInfoSummary
+        summary = TrendAggregator.aggregate(
+            raw_items=all_items,
+            domain=domain,
+            max_jd=5,
+            max_exp=5,
+            max_keywords=20
+        )
+
+        logger.info(
+            f"External info retrieved: {len(summary.job_descriptions)} JDs, "
+            f"{len(summary.interview_experiences)} experiences"
+        )
+
+        return summary
+
+    @staticmethod
+    def _summary_cache_key(
+        user_config: UserConfig,
+        resume_keywords: Optional[List[str]]
+    ) -> Tuple:
+        """
+        生成聚合结果缓存键
+
+        检索只依赖领域、目标描述和简历关键词，其余配置字段不参与
+
+        Args:
+            user_config: 用户配置
+            resume_keywords: 从简历中提取的关键词
+
+        Returns:
+            可哈希的缓存键
+        """
+        return (
+            user_config.domain or 'backend',
+            user_config.target_desc or '',
+            tuple(resume_keywords or ())
+        )
+
+    def _get_cached_summary(self, cache_key: Tuple) -> Optional[ExternalInfoSummary]:
+        """读取未过期的聚合结果缓存"""
+        if not self.config.use_cache:
+            return None
+
+        with self._summary_cache_lock:
+            entry = self._summary_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            expires_at, summary = entry
+            if time.time() > expires_at:
+                del self._summary_cache[cache_key]
+                return None
+
+            self._summary_cache.move_to_end(cache_key)
+            return summary
+
+    def _set_cached_summary(self, cache_key: Tuple, summary: ExternalInfoSummary):
+        """保存聚合结果缓存（超出容量时淘汰最久未使用的条目）"""
+        if not self.config.use_cache:
+            return
+
+        with self._summary_cache_lock:
+            self._summary_cache[cache_key] = (time.time() + self.config.cache_ttl, summary)
+            self._summary_cache.move_to_end(cache_key)
+            while len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+
     def _crawl_all_sources(
         self,
         domain: str,
@@ -187,6 +334,43 @@ class MultiSourceCrawlerProvider:
 
         return results
 
+    async def _crawl_all_sources_async(
+        self,
+        domain: str,
+        keywords: List[str]
+    ) -> List[CrawlerResult]:
+        """
+        在事件循环中并发爬取所有数据源
+
+        Args:
+            domain: 目标领域
+            keywords: 关键词列表
+
+        Returns:
+            CrawlerResult列表
+        """
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(crawler.crawl_async(domain, keywords), timeout=30)  # 30秒超时
+                for crawler in self.crawlers
+            ),
+            return_exceptions=True
+        )
+
+        results = []
+        for crawler, outcome in zip(self.crawlers, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Crawler {crawler.source_name} failed: {outcome!r}")
+                results.append(CrawlerResult(
+                    source=crawler.source_name,
+                    success=False,
+                    error_message=str(outcome) or type(outcome).__name__
+                ))
+            else:
+                results.append(outcome)
+
+        return results
+
     def _extract_keywords_from_desc(self, description: str) -> List[str]:
         """
         从目标描述中提取关键词
@@ -229,8 +413,7 @@ class MultiSourceCrawlerProvider:
         if summary is None:
             return "未检索到外部信息。"
 
-        lines = []
-        lines.append("### 外部技术趋势参考（来自GitHub、CSDN等真实数据源）")
+        lines = ["### 外部技术趋势参考（来自GitHub、CSDN等真实数据源）"]
 
         # JD信息
         if summary.job_descriptions:
@@ -249,8 +432,7 @@ class MultiSourceCrawlerProvider:
 
             if summary.high_frequency_questions:
                 lines.append("\n**高频技术问题示例**:")
-                for q in summary.high_frequency_questions[:5]:
-                    lines.append(f"- {q}")
+                lines.extend(f"- {q}" for q in summary.high_frequency_questions[:5])
 
         lines.append("\n**提示**: 根据以上真实技术趋势和面经，生成的问题应更贴近当前行业实际。")
 
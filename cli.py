@@ -16,10 +16,9 @@ import argparse
 import json
 import os
 import sys
-from pathlib import Path
 
 # 添加app目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.models import UserConfig
 from app.core.pipeline import GrillRadarPipeline
@@ -0,0 +1,14 @@
+"""
+脚本公共启动设置 - 将项目根目录加入 sys.path
+
+用法（放在导入 app 包之前）:
+    import _bootstrap  # noqa: F401
+"""
+import os
+import sys
+
+# os.path 仅做字符串运算，不访问文件系统
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -0,0 +1,36 @@
+"""
+脚本公共输出工具
+
+用法:
+    from _output import make_line_collector, print_items
+"""
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.sources.crawlers.models import RawItem
+
+
+def make_line_collector() -> Tuple[Callable[..., None], List[str]]:
+    """
+    创建输出行收集器（并行执行时各任务先收集输出，结束后再统一打印，避免输出交错）
+
+    Returns:
+        (log, lines): log(text="") 追加一行到 lines
+    """
+    lines: List[str] = []
+
+    def log(text: str = "") -> None:
+        lines.append(str(text))
+
+    return log, lines
+
+
+def print_items(heading: str, items: "List[RawItem]", type_default: Optional[str] = None):
+    """输出前5条结果（整段拼接后一次写出）"""
+    lines = ["", heading]
+    for i, item in enumerate(items[:5], 1):
+        lines.append(f"\n{i}. {item.title}")
+        lines.append(f"   链接: {item.url}")
+        if type_default:
+            lines.append(f"   类型: {item.metadata.get('content_type', type_default)}")
+    print("\n".join(lines))
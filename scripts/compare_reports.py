@@ -27,7 +27,7 @@ from pathlib import Path
 from typing import Optional
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import _bootstrap  # noqa: F401
 
 from app.models.report import Report
 from app.eval.report_quality import compare_reports, format_comparison
@@ -11,7 +11,7 @@ Usage:
     # Evaluate using custom config and resume
     python scripts/eval_report.py --config config.json --resume resume.md
 
-    # Save report JSON for later comparison
+    # Save report JSON for later comparison (add --pretty for indented JSON)
     python scripts/eval_report.py --case job_llm_app --output report_v1.json
 
     # Use custom provider/model
@@ -24,10 +24,14 @@ import yaml
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON serialization
+    orjson = None
+
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import _bootstrap
 
-from app.core.pipeline import GrillRadarPipeline
 from app.models.user_config import UserConfig
 from app.models.report import Report
 from app.eval.report_quality import evaluate_report, format_quality_summary
@@ -54,15 +58,32 @@ def load_resume(resume_path: Path) -> str:
         return f.read()
 
 
-def save_report(report: Report, output_path: Path):
-    """Save report to JSON file"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Use model_dump for Pydantic v2
-        if hasattr(report, 'model_dump'):
-            json.dump(report.model_dump(), f, ensure_ascii=False, indent=2)
-        else:
-            # Fallback for Pydantic v1
-            json.dump(report.dict(), f, ensure_ascii=False, indent=2)
+def save_report(report: Report, output_path: Path, pretty: bool = False):
+    """
+    Save report to JSON file (uses orjson when installed)
+
+    Args:
+        report: Report to save
+        output_path: Destination JSON file
+        pretty: Indent the JSON for human reading (compact otherwise)
+    """
+    # Use model_dump for Pydantic v2, fall back to dict() for Pydantic v1
+    data = report.model_dump() if hasattr(report, 'model_dump') else report.dict()
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        # orjson emits UTF-8 bytes directly (no ASCII escaping)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(
+                data, f, ensure_ascii=False,
+                indent=2 if pretty else None,
+                separators=None if pretty else (',', ':')
+            )
 
 
 def run_evaluation(
@@ -71,7 +92,8 @@ def run_evaluation(
     output_path: Optional[Path] = None,
     provider: Optional[str] = None,
     model: Optional[str] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    pretty: bool = False
 ) -> Report:
     """
     Run report generation and evaluation
@@ -83,6 +105,7 @@ def run_evaluation(
         provider: Optional LLM provider override
         model: Optional LLM model override
         verbose: Whether to print detailed output
+        pretty: Whether to indent the saved report JSON
 
     Returns:
         Generated Report object
@@ -100,6 +123,9 @@ def run_evaluation(
     print(f"🤖 Generating report (mode={user_config.mode}, domain={user_config.domain})...")
     print()
 
+    # Imported lazily so --help and argument errors skip the LLM stack
+    from app.core.pipeline import GrillRadarPipeline
+
     # Initialize pipeline
     pipeline = GrillRadarPipeline(
         llm_provider=provider,
@@ -112,7 +138,7 @@ def run_evaluation(
     # Save report if requested
     if output_path:
         print(f"💾 Saving report to: {output_path}")
-        save_report(report, output_path)
+        save_report(report, output_path, pretty=pretty)
         print()
 
     # Evaluate quality
@@ -173,6 +199,11 @@ Examples:
         type=Path,
         help='Path to save report JSON for later comparison'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent the saved report JSON (compact by default)'
+    )
 
     # LLM options
     parser.add_argument(
@@ -200,7 +231,7 @@ Examples:
         parser.error("--resume is required when using --config")
 
     # Resolve paths
-    project_root = Path(__file__).parent.parent
+    project_root = Path(_bootstrap.PROJECT_ROOT)
 
     if args.case:
         # Load test case
@@ -244,7 +275,8 @@ Examples:
             output_path=args.output,
             provider=args.provider,
             model=args.model,
-            verbose=not args.quiet
+            verbose=not args.quiet,
+            pretty=args.pretty
         )
         sys.exit(0)
     except Exception as e:
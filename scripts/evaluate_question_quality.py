@@ -13,12 +13,17 @@ Usage:
     python scripts/evaluate_question_quality.py
     python scripts/evaluate_question_quality.py --verbose
     python scripts/evaluate_question_quality.py --case job_backend
+
+Keyword checks use a pyahocorasick automaton when it is installed
+(pip install pyahocorasick) and fall back to plain substring scans otherwise.
 """
+import re
 import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -26,13 +31,92 @@ from enum import Enum
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv(override=True)
+try:
+    import ahocorasick
+except ImportError:  # optional speedup for KeywordMatcher
+    ahocorasick = None
 
 from app.models.user_config import UserConfig
 from app.models.report import Report, QuestionItem
-from app.core.report_generator import ReportGenerator
+
+# Matches any digit (used to detect specific numbers/versions in text)
+_DIGIT_RE = re.compile(r'\d')
+
+# Structural indicators in a baseline answer: paragraphs (two line breaks),
+# numbered items, bullets, or section markers
+_STRUCTURE_RE = re.compile(r'\n[^\n]*\n|[1-9]\.|[•\-#：]|\*\*')
+
+
+def _write_lines(lines: List[str]):
+    """Write a block of output lines to stdout with a single write"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+
+# Overly generic question openers
+GENERIC_PATTERNS = [
+    "请介绍",
+    "请说明",
+    "请描述",
+    "你能说说",
+    "你了解",
+]
+
+# Keywords that indicate contextual relevance of a rationale
+CONTEXT_KEYWORDS = [
+    "简历", "resume", "经历", "experience", "项目", "project",
+    "岗位", "position", "目标", "target", "申请", "application",
+    "领域", "domain", "方向", "direction", "专业", "major",
+    "技能", "skill", "背景", "background", "工作", "work",
+    "研究", "research", "论文", "paper", "实习", "intern"
+]
+
+# Support notes indicators (technical terms are matched case-sensitively)
+TECH_TERMS = ['API', 'HTTP', 'SQL', 'CPU', 'GPU', 'RAM']
+CONCEPT_TERMS = ['algorithm', '算法', 'pattern', '模式', 'theory', '理论']
+RESOURCE_TERMS = ['paper', '论文', 'book', '书', 'doc', '文档', 'article', '文章']
+
+
+class KeywordMatcher:
+    """Reports which keyword categories occur in a text in a single pass"""
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self._categories = categories
+        self._automaton = None
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for category, keywords in categories.items():
+                for keyword in keywords:
+                    # A keyword may belong to several categories (e.g. "paper")
+                    automaton.add_word(keyword, automaton.get(keyword, ()) + (category,))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str) -> Set[str]:
+        """Return the set of categories with at least one keyword in text"""
+        if self._automaton is None:
+            return {
+                category for category, keywords in self._categories.items()
+                if any(keyword in text for keyword in keywords)
+            }
+
+        hits = set()
+        for _, categories in self._automaton.iter(text):
+            hits.update(categories)
+            if len(hits) == len(self._categories):
+                break
+        return hits
+
+
+# Case-insensitive categories, matched against lowercased text
+_KEYWORD_MATCHER = KeywordMatcher({
+    "generic": GENERIC_PATTERNS,
+    "context": CONTEXT_KEYWORDS,
+    "concept": CONCEPT_TERMS,
+    "resource": RESOURCE_TERMS,
+})
+_TECH_MATCHER = KeywordMatcher({"tech": TECH_TERMS})
 
 
 # Quality Check Results
@@ -43,7 +127,7 @@ class CheckSeverity(Enum):
     FAIL = "✗ FAIL"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityIssue:
     """Represents a quality issue found in a question"""
     check_name: str
@@ -52,7 +136,7 @@ class QualityIssue:
     details: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionQualityReport:
     """Quality report for a single question"""
     question_id: int
@@ -60,6 +144,9 @@ class QuestionQualityReport:
     issues: List[QualityIssue] = field(default_factory=list)
     passed_checks: int = 0
     total_checks: int = 0
+    # Maintained by QuestionQualityChecker as issues are appended
+    has_failures: bool = False
+    has_warnings: bool = False
 
     @property
     def pass_rate(self) -> float:
@@ -68,20 +155,13 @@ class QuestionQualityReport:
             return 0.0
         return (self.passed_checks / self.total_checks) * 100
 
-    @property
-    def has_failures(self) -> bool:
-        """Check if there are any FAIL severity issues"""
-        return any(issue.severity == CheckSeverity.FAIL for issue in self.issues)
-
-    @property
-    def has_warnings(self) -> bool:
-        """Check if there are any WARNING severity issues"""
-        return any(issue.severity == CheckSeverity.WARNING for issue in self.issues)
-
 
 class QuestionQualityChecker:
     """Evaluates the quality of generated questions"""
 
+    # Number of checks run by check_question
+    TOTAL_CHECKS = 9
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
@@ -89,6 +169,9 @@ class QuestionQualityChecker:
         """
         Run all quality checks on a single question
 
+        All checks run in a single pass: each field and its length are read
+        once up front, then every check appends at most one issue.
+
         Args:
             question: The QuestionItem to evaluate
 
@@ -99,241 +182,170 @@ class QuestionQualityChecker:
             question_id=question.id,
             question_text=question.question
         )
-
-        # Run all checks
-        checks = [
-            self._check_question_length,
-            self._check_question_clarity,
-            self._check_rationale_length,
-            self._check_rationale_context,
-            self._check_baseline_answer_structure,
-            self._check_baseline_answer_depth,
-            self._check_support_notes_specificity,
-            self._check_support_notes_length,
-            self._check_prompt_template_validity,
-        ]
-
-        for check_func in checks:
-            issue = check_func(question)
-            report.total_checks += 1
-
-            if issue:
-                report.issues.append(issue)
-                if issue.severity != CheckSeverity.FAIL:
-                    report.passed_checks += 1  # WARNING still counts as passed
-            else:
-                report.passed_checks += 1
-
-        return report
-
-    # ==================== Individual Quality Checks ====================
-
-    def _check_question_length(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if question is too short"""
-        length = len(q.question)
-
-        if length < 10:
-            return QualityIssue(
+        issues = report.issues
+
+        q_text = question.question
+        rationale = question.rationale
+        answer = question.baseline_answer
+        notes = question.support_notes
+        template = question.prompt_template
+
+        q_len = len(q_text)
+        rationale_len = len(rationale)
+        answer_len = len(answer)
+        notes_len = len(notes)
+
+        # Lowercase each field at most once and scan it for keywords once
+        question_lower = q_text.lower()
+        rationale_lower = rationale.lower()
+        question_hits = _KEYWORD_MATCHER.match(question_lower)
+        rationale_hits = _KEYWORD_MATCHER.match(rationale_lower)
+
+        # Question length
+        if q_len < 10:
+            issues.append(QualityIssue(
                 check_name="Question Length",
                 severity=CheckSeverity.FAIL,
-                message=f"Question too short ({length} chars)",
+                message=f"Question too short ({q_len} chars)",
                 details="Questions should be at least 10 characters"
-            )
-        elif length < 20:
-            return QualityIssue(
+            ))
+        elif q_len < 20:
+            issues.append(QualityIssue(
                 check_name="Question Length",
                 severity=CheckSeverity.WARNING,
-                message=f"Question is short ({length} chars)",
+                message=f"Question is short ({q_len} chars)",
                 details="Consider making questions more specific (20+ chars recommended)"
-            )
-        return None
-
-    def _check_question_clarity(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if question is clear and not too generic"""
-        question_lower = q.question.lower()
-
-        # Check for overly generic patterns
-        generic_patterns = [
-            "请介绍",
-            "请说明",
-            "请描述",
-            "你能说说",
-            "你了解",
-        ]
-
-        is_generic = any(pattern in question_lower for pattern in generic_patterns)
-
-        # Check if question has specific technical terms or context
-        has_specific_context = any(char.isdigit() for char in q.question) or \
-                               len(q.question.split()) > 8
-
-        if is_generic and not has_specific_context:
-            return QualityIssue(
+            ))
+
+        # Question clarity: generic openers without specific context
+        if "generic" in question_hits and not (
+            _DIGIT_RE.search(q_text) or len(q_text.split()) > 8
+        ):
+            issues.append(QualityIssue(
                 check_name="Question Clarity",
                 severity=CheckSeverity.WARNING,
                 message="Question may be too generic",
                 details="Consider adding specific context or technical details"
-            )
-        return None
-
-    def _check_rationale_length(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if rationale is sufficiently detailed"""
-        length = len(q.rationale)
+            ))
 
-        if length < 30:
-            return QualityIssue(
+        # Rationale length
+        if rationale_len < 30:
+            issues.append(QualityIssue(
                 check_name="Rationale Length",
                 severity=CheckSeverity.FAIL,
-                message=f"Rationale too short ({length} chars)",
+                message=f"Rationale too short ({rationale_len} chars)",
                 details="Rationale should explain why this question matters (30+ chars)"
-            )
-        elif length < 50:
-            return QualityIssue(
+            ))
+        elif rationale_len < 50:
+            issues.append(QualityIssue(
                 check_name="Rationale Length",
                 severity=CheckSeverity.WARNING,
-                message=f"Rationale is brief ({length} chars)",
+                message=f"Rationale is brief ({rationale_len} chars)",
                 details="More detailed rationale improves question value (50+ chars recommended)"
-            )
-        return None
-
-    def _check_rationale_context(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if rationale mentions resume/target/domain context"""
-        rationale_lower = q.rationale.lower()
-
-        # Keywords that indicate contextual relevance
-        context_keywords = [
-            "简历", "resume", "经历", "experience", "项目", "project",
-            "岗位", "position", "目标", "target", "申请", "application",
-            "领域", "domain", "方向", "direction", "专业", "major",
-            "技能", "skill", "背景", "background", "工作", "work",
-            "研究", "research", "论文", "paper", "实习", "intern"
-        ]
-
-        has_context = any(keyword in rationale_lower for keyword in context_keywords)
-
-        if not has_context:
-            return QualityIssue(
+            ))
+
+        # Rationale context: mentions resume/target/domain
+        if "context" not in rationale_hits:
+            issues.append(QualityIssue(
                 check_name="Rationale Context",
                 severity=CheckSeverity.WARNING,
                 message="Rationale lacks specific context",
                 details="Rationale should reference resume content, target position, or domain"
-            )
-        return None
-
-    def _check_baseline_answer_structure(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if baseline answer has clear structure"""
-        answer = q.baseline_answer
+            ))
 
-        # Check for structural indicators
-        has_paragraphs = answer.count('\n\n') >= 1 or answer.count('\n') >= 2
-        has_bullets = '•' in answer or '-' in answer or any(f"{i}." in answer for i in range(1, 10))
-        has_sections = '**' in answer or '#' in answer or '：' in answer
-
-        structure_score = sum([has_paragraphs, has_bullets, has_sections])
-
-        if structure_score == 0:
-            return QualityIssue(
+        # Baseline answer structure: paragraphs, bullets or sections
+        if not _STRUCTURE_RE.search(answer):
+            issues.append(QualityIssue(
                 check_name="Answer Structure",
                 severity=CheckSeverity.WARNING,
                 message="Baseline answer lacks clear structure",
                 details="Consider adding paragraphs, bullet points, or sections"
-            )
-        return None
-
-    def _check_baseline_answer_depth(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if baseline answer is detailed enough"""
-        length = len(q.baseline_answer)
+            ))
 
-        if length < 50:
-            return QualityIssue(
+        # Baseline answer depth
+        if answer_len < 50:
+            issues.append(QualityIssue(
                 check_name="Answer Depth",
                 severity=CheckSeverity.FAIL,
-                message=f"Baseline answer too short ({length} chars)",
+                message=f"Baseline answer too short ({answer_len} chars)",
                 details="Answer should provide substantial guidance (50+ chars minimum)"
-            )
-        elif length < 100:
-            return QualityIssue(
+            ))
+        elif answer_len < 100:
+            issues.append(QualityIssue(
                 check_name="Answer Depth",
                 severity=CheckSeverity.WARNING,
-                message=f"Baseline answer is brief ({length} chars)",
+                message=f"Baseline answer is brief ({answer_len} chars)",
                 details="More detailed answers help users prepare better (200+ chars recommended)"
-            )
-        return None
-
-    def _check_support_notes_specificity(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if support notes provide specific knowledge points"""
-        notes = q.support_notes
-        notes_lower = notes.lower()
-
-        # Check for specific technical terms, concepts, or resources
-        specific_indicators = [
-            # Technical terms
-            any(term in notes for term in ['API', 'HTTP', 'SQL', 'CPU', 'GPU', 'RAM']),
-            # Algorithms/concepts
-            any(term in notes_lower for term in ['algorithm', '算法', 'pattern', '模式', 'theory', '理论']),
-            # Resources
-            any(term in notes_lower for term in ['paper', '论文', 'book', '书', 'doc', '文档', 'article', '文章']),
-            # Specific numbers or versions
-            any(char.isdigit() for char in notes),
-        ]
-
-        if not any(specific_indicators):
-            return QualityIssue(
+            ))
+
+        # Support notes specificity: numbers and technical terms are checked on
+        # the raw text first, so the notes are only lowercased when needed
+        notes_specific = bool(_DIGIT_RE.search(notes) or _TECH_MATCHER.match(notes))
+        if not notes_specific:
+            notes_hits = _KEYWORD_MATCHER.match(notes.lower())
+            notes_specific = "concept" in notes_hits or "resource" in notes_hits
+
+        if not notes_specific:
+            issues.append(QualityIssue(
                 check_name="Support Notes Specificity",
                 severity=CheckSeverity.WARNING,
                 message="Support notes lack specific knowledge points",
                 details="Include specific concepts, papers, tools, or resources"
-            )
-        return None
+            ))
 
-    def _check_support_notes_length(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if support notes are detailed enough"""
-        length = len(q.support_notes)
-
-        if length < 20:
-            return QualityIssue(
+        # Support notes length
+        if notes_len < 20:
+            issues.append(QualityIssue(
                 check_name="Support Notes Length",
                 severity=CheckSeverity.FAIL,
-                message=f"Support notes too short ({length} chars)",
+                message=f"Support notes too short ({notes_len} chars)",
                 details="Support notes should provide learning resources (20+ chars)"
-            )
-        elif length < 50:
-            return QualityIssue(
+            ))
+        elif notes_len < 50:
+            issues.append(QualityIssue(
                 check_name="Support Notes Length",
                 severity=CheckSeverity.WARNING,
-                message=f"Support notes are brief ({length} chars)",
+                message=f"Support notes are brief ({notes_len} chars)",
                 details="More detailed notes improve learning value (100+ chars recommended)"
-            )
-        return None
-
-    def _check_prompt_template_validity(self, q: QuestionItem) -> QualityIssue | None:
-        """Check if prompt template contains placeholders"""
-        template = q.prompt_template
+            ))
 
-        # Check for common placeholders
-        placeholders = ['{', '{{', '[', '【']
-        has_placeholder = any(ph in template for ph in placeholders)
-
-        # Check if template is different from question (should be more detailed)
-        is_different = template != q.question and len(template) > len(q.question)
-
-        if not has_placeholder:
-            return QualityIssue(
+        # Prompt template: placeholders and expansion of the question
+        if not any(ph in template for ph in ('{', '{{', '[', '【')):
+            issues.append(QualityIssue(
                 check_name="Prompt Template",
                 severity=CheckSeverity.WARNING,
                 message="Prompt template lacks placeholders",
                 details="Template should contain placeholders like {your_experience} for practice"
-            )
-
-        if not is_different:
-            return QualityIssue(
+            ))
+        elif template == q_text or len(template) <= q_len:
+            issues.append(QualityIssue(
                 check_name="Prompt Template",
                 severity=CheckSeverity.WARNING,
                 message="Prompt template is too similar to question",
                 details="Template should expand the question with context and placeholders"
-            )
+            ))
 
-        return None
+        # Each check yields at most one issue; WARNING still counts as passed
+        failures = sum(1 for issue in issues if issue.severity is CheckSeverity.FAIL)
+        report.total_checks = self.TOTAL_CHECKS
+        report.passed_checks = self.TOTAL_CHECKS - failures
+        report.has_failures = failures > 0
+        report.has_warnings = len(issues) > failures
+
+        return report
+
+    def check_questions(self, questions: List[QuestionItem]) -> List[QuestionQualityReport]:
+        """
+        Run all quality checks on a batch of questions
+
+        Args:
+            questions: The QuestionItems to evaluate
+
+        Returns:
+            One QuestionQualityReport per question, in input order
+        """
+        check = self.check_question
+        return [check(question) for question in questions]
 
 
 class QualityEvaluationRunner:
@@ -342,6 +354,21 @@ class QualityEvaluationRunner:
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.checker = QuestionQualityChecker(verbose=verbose)
+        # path -> (mtime_ns, size, content); avoids re-reading unchanged case files
+        self._file_cache: Dict[Path, Tuple[int, int, str]] = {}
+
+    def _read(self, path: Path) -> str:
+        """Read a text file, reusing the cached content if it has not changed"""
+        stat = path.stat()
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        self._file_cache[path] = (stat.st_mtime_ns, stat.st_size, content)
+        return content
 
     def load_test_case(self, case_name: str) -> Tuple[str, Dict]:
         """Load resume and config for a test case"""
@@ -355,20 +382,13 @@ class QualityEvaluationRunner:
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(resume_path, 'r', encoding='utf-8') as f:
-            resume_text = f.read()
-
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        resume_text = self._read(resume_path)
+        config_data = json.loads(self._read(config_path))
 
         return resume_text, config_data
 
     def generate_report(self, case_name: str) -> Report:
         """Generate report for a test case"""
-        print(f"\n{'='*70}")
-        print(f"📊 Generating Report for: {case_name}")
-        print(f"{'='*70}")
-
         resume_text, config_data = self.load_test_case(case_name)
 
         user_config = UserConfig(
@@ -379,104 +399,133 @@ class QualityEvaluationRunner:
             enable_external_info=config_data.get("enable_external_info", False)
         )
 
-        print(f"  Mode: {user_config.mode}")
-        print(f"  Target: {user_config.target_desc}")
-        print(f"  Domain: {user_config.domain}")
-        print(f"  Resume length: {len(resume_text)} chars")
-        print(f"\n  Calling LLM to generate report...")
-        print(f"  (This may take 30-60 seconds)")
+        # One write per block keeps output from concurrent cases readable
+        _write_lines([
+            f"\n{'='*70}",
+            f"📊 Generating Report for: {case_name}",
+            f"{'='*70}",
+            f"  Mode: {user_config.mode}",
+            f"  Target: {user_config.target_desc}",
+            f"  Domain: {user_config.domain}",
+            f"  Resume length: {len(resume_text)} chars",
+            f"\n  Calling LLM to generate report...",
+            f"  (This may take 30-60 seconds)",
+        ])
+
+        # Imported lazily so --help and argument errors skip the LLM stack
+        from app.core.report_generator import ReportGenerator
 
         generator = ReportGenerator()
         report = generator.generate_report(user_config)
 
-        print(f"  ✓ Report generated successfully!")
-        print(f"  ✓ Questions: {len(report.questions)}")
-        print(f"  ✓ Mode: {report.mode}")
+        _write_lines([
+            f"  ✓ Report generated successfully! ({case_name})",
+            f"  ✓ Questions: {len(report.questions)}",
+            f"  ✓ Mode: {report.mode}",
+        ])
 
         return report
 
     def evaluate_report(self, report: Report, case_name: str) -> List[QuestionQualityReport]:
         """Evaluate all questions in a report"""
-        print(f"\n{'='*70}")
-        print(f"🔍 Quality Evaluation: {case_name}")
-        print(f"{'='*70}")
+        _write_lines([
+            f"\n{'='*70}",
+            f"🔍 Quality Evaluation: {case_name}",
+            f"{'='*70}",
+        ])
 
-        question_reports = []
+        return self.checker.check_questions(report.questions)
 
-        for question in report.questions:
-            quality_report = self.checker.check_question(question)
-            question_reports.append(quality_report)
+    @staticmethod
+    def summarize(question_reports: List[QuestionQualityReport]) -> Tuple[int, int, int, float]:
+        """
+        Aggregate per-question results in a single pass
 
-        return question_reports
+        Returns:
+            (total_issues, total_failures, total_warnings, avg_pass_rate), where
+            total_warnings counts questions with warnings but no failures
+        """
+        total_issues = total_failures = total_warnings = 0
+        total_pass_rate = 0.0
+
+        for qr in question_reports:
+            total_issues += len(qr.issues)
+            if qr.has_failures:
+                total_failures += 1
+            elif qr.has_warnings:
+                total_warnings += 1
+            total_pass_rate += qr.pass_rate
+
+        return total_issues, total_failures, total_warnings, total_pass_rate / len(question_reports)
 
     def print_results(self, question_reports: List[QuestionQualityReport], case_name: str):
         """Print human-readable evaluation results"""
-        print(f"\n{'='*70}")
-        print(f"📋 Quality Report Summary: {case_name}")
-        print(f"{'='*70}\n")
+        out: List[str] = []
+        out.append(f"\n{'='*70}")
+        out.append(f"📋 Quality Report Summary: {case_name}")
+        out.append(f"{'='*70}\n")
 
         total_questions = len(question_reports)
-        total_issues = sum(len(qr.issues) for qr in question_reports)
-        total_failures = sum(1 for qr in question_reports if qr.has_failures)
-        total_warnings = sum(1 for qr in question_reports if qr.has_warnings and not qr.has_failures)
+        total_issues, total_failures, total_warnings, avg_pass_rate = self.summarize(question_reports)
         total_passed = total_questions - total_failures - total_warnings
 
         # Overall statistics
-        print(f"📊 Overall Statistics:")
-        print(f"  Total Questions: {total_questions}")
-        print(f"  ✓ Passed: {total_passed} ({total_passed/total_questions*100:.1f}%)")
-        print(f"  ⚠ Warnings: {total_warnings} ({total_warnings/total_questions*100:.1f}%)")
-        print(f"  ✗ Failures: {total_failures} ({total_failures/total_questions*100:.1f}%)")
-        print(f"  Total Issues: {total_issues}")
-        print()
+        out.append(f"📊 Overall Statistics:")
+        out.append(f"  Total Questions: {total_questions}")
+        out.append(f"  ✓ Passed: {total_passed} ({total_passed/total_questions*100:.1f}%)")
+        out.append(f"  ⚠ Warnings: {total_warnings} ({total_warnings/total_questions*100:.1f}%)")
+        out.append(f"  ✗ Failures: {total_failures} ({total_failures/total_questions*100:.1f}%)")
+        out.append(f"  Total Issues: {total_issues}")
+        out.append("")
 
         # Per-question details
         for qr in question_reports:
             status_icon = "✓" if not qr.has_failures and not qr.has_warnings else \
                          "⚠" if qr.has_warnings else "✗"
 
-            print(f"{status_icon} Question {qr.question_id}: {qr.question_text[:60]}...")
-            print(f"  Pass Rate: {qr.pass_rate:.0f}% ({qr.passed_checks}/{qr.total_checks} checks)")
+            out.append(f"{status_icon} Question {qr.question_id}: {qr.question_text[:60]}...")
+            out.append(f"  Pass Rate: {qr.pass_rate:.0f}% ({qr.passed_checks}/{qr.total_checks} checks)")
 
             if qr.issues:
                 for issue in qr.issues:
-                    print(f"    {issue.severity.value} {issue.check_name}: {issue.message}")
+                    out.append(f"    {issue.severity.value} {issue.check_name}: {issue.message}")
                     if self.verbose and issue.details:
-                        print(f"       → {issue.details}")
+                        out.append(f"       → {issue.details}")
             else:
-                print(f"    All checks passed!")
-            print()
+                out.append(f"    All checks passed!")
+            out.append("")
 
         # Quality recommendations
-        print(f"{'='*70}")
-        print(f"💡 Recommendations:")
-        print(f"{'='*70}\n")
+        out.append(f"{'='*70}")
+        out.append(f"💡 Recommendations:")
+        out.append(f"{'='*70}\n")
 
         if total_failures > 0:
-            print(f"⚠️  CRITICAL: {total_failures} questions have FAIL-level issues.")
-            print(f"   → Review and fix these questions before production use.\n")
+            out.append(f"⚠️  CRITICAL: {total_failures} questions have FAIL-level issues.")
+            out.append(f"   → Review and fix these questions before production use.\n")
 
         if total_warnings > 0:
-            print(f"⚠️  {total_warnings} questions have warnings.")
-            print(f"   → Consider improving these for better quality.\n")
+            out.append(f"⚠️  {total_warnings} questions have warnings.")
+            out.append(f"   → Consider improving these for better quality.\n")
 
         if total_passed == total_questions:
-            print(f"✅ Excellent! All questions passed quality checks!")
-            print(f"   → Questions are ready for production use.\n")
+            out.append(f"✅ Excellent! All questions passed quality checks!")
+            out.append(f"   → Questions are ready for production use.\n")
 
-        # Calculate overall quality score
-        avg_pass_rate = sum(qr.pass_rate for qr in question_reports) / len(question_reports)
-        print(f"📈 Overall Quality Score: {avg_pass_rate:.1f}%")
+        # Overall quality score
+        out.append(f"📈 Overall Quality Score: {avg_pass_rate:.1f}%")
 
         if avg_pass_rate >= 90:
-            print(f"   Grade: A (Excellent)")
+            out.append(f"   Grade: A (Excellent)")
         elif avg_pass_rate >= 80:
-            print(f"   Grade: B (Good)")
+            out.append(f"   Grade: B (Good)")
         elif avg_pass_rate >= 70:
-            print(f"   Grade: C (Acceptable)")
+            out.append(f"   Grade: C (Acceptable)")
         else:
-            print(f"   Grade: D (Needs Improvement)")
-        print()
+            out.append(f"   Grade: D (Needs Improvement)")
+        out.append("")
+
+        _write_lines(out)
 
 
 def main():
@@ -531,6 +580,10 @@ def main():
         print(f"   Available cases: {', '.join(available_cases)}")
         sys.exit(1)
 
+    # Load environment variables (LLM credentials) once arguments are valid
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+
     print(f"📦 Test cases to evaluate: {', '.join(cases_to_run)}")
     print(f"🔧 Verbose mode: {'ON' if args.verbose else 'OFF'}")
     print()
@@ -538,46 +591,59 @@ def main():
     # Run evaluation for each case
     all_results = {}
 
-    for case_name in cases_to_run:
-        try:
-            # Generate report
-            if not args.skip_generation:
-                report = runner.generate_report(case_name)
-            else:
-                print(f"⚠️  Skipping generation for {case_name} (not implemented)")
-                continue
+    if args.skip_generation:
+        for case_name in cases_to_run:
+            print(f"⚠️  Skipping generation for {case_name} (not implemented)")
+        cases_to_generate = []
+    else:
+        cases_to_generate = cases_to_run
 
-            # Evaluate questions
-            question_reports = runner.evaluate_report(report, case_name)
+    # Report generation is dominated by LLM latency, so generate all cases
+    # concurrently and evaluate each one on the main thread as it completes
+    if cases_to_generate:
+        with ThreadPoolExecutor(max_workers=len(cases_to_generate)) as executor:
+            futures = {
+                executor.submit(runner.generate_report, case_name): case_name
+                for case_name in cases_to_generate
+            }
 
-            # Print results
-            runner.print_results(question_reports, case_name)
+            for future in as_completed(futures):
+                case_name = futures[future]
+                try:
+                    report = future.result()
 
-            all_results[case_name] = question_reports
+                    # Evaluate questions
+                    question_reports = runner.evaluate_report(report, case_name)
 
-        except Exception as e:
-            print(f"\n❌ Error evaluating {case_name}: {e}")
-            if args.verbose:
-                import traceback
-                traceback.print_exc()
-            continue
+                    # Print results
+                    runner.print_results(question_reports, case_name)
+
+                    all_results[case_name] = question_reports
+
+                except Exception as e:
+                    print(f"\n❌ Error evaluating {case_name}: {e}")
+                    if args.verbose:
+                        import traceback
+                        traceback.print_exc()
 
     # Final summary for multiple cases
     if len(cases_to_run) > 1:
-        print(f"\n{'='*70}")
-        print(f"🏆 Multi-Case Summary")
-        print(f"{'='*70}\n")
+        out = []
+        out.append(f"\n{'='*70}")
+        out.append(f"🏆 Multi-Case Summary")
+        out.append(f"{'='*70}\n")
 
-        for case_name, question_reports in all_results.items():
-            avg_pass_rate = sum(qr.pass_rate for qr in question_reports) / len(question_reports)
-            total_failures = sum(1 for qr in question_reports if qr.has_failures)
-            total_warnings = sum(1 for qr in question_reports if qr.has_warnings and not qr.has_failures)
+        for case_name in cases_to_run:
+            if case_name not in all_results:
+                continue
+            _, total_failures, total_warnings, avg_pass_rate = runner.summarize(all_results[case_name])
 
             status = "✓" if total_failures == 0 else "✗"
-            print(f"{status} {case_name:20s} - Quality: {avg_pass_rate:5.1f}% | "
+            out.append(f"{status} {case_name:20s} - Quality: {avg_pass_rate:5.1f}% | "
                   f"Warnings: {total_warnings:2d} | Failures: {total_failures:2d}")
 
-        print()
+        out.append("")
+        _write_lines(out)
 
     print("✅ Evaluation complete!")
 
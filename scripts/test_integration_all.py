@@ -10,13 +10,11 @@
 5. 多源聚合
 6. 缓存机制
 """
-import sys
-from pathlib import Path
+import asyncio
 import time
 
 # 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import _bootstrap  # noqa: F401
 
 from app.sources.multi_source_provider import MultiSourceCrawlerProvider
 from app.sources.crawlers.models import CrawlerConfig
@@ -24,12 +22,16 @@ from app.sources.crawlers.keyword_filter import create_filter_from_string
 from app.sources.crawlers.cache_manager import get_cache_manager
 from app.models.user_config import UserConfig
 
+# 输出分隔线
+BANNER = "=" * 80
+DIVIDER = "-" * 80
+
 
 def test_integration():
     """综合集成测试"""
-    print("=" * 80)
+    print(BANNER)
     print("🚀 GrillRadar 多源爬虫系统综合集成测试")
-    print("=" * 80)
+    print(BANNER)
     print()
     print("测试组件:")
     print("  ✓ IT之家 API 爬虫 (newsnow API)")
@@ -38,12 +40,12 @@ def test_integration():
     print("  ✓ 智能去重和质量评分")
     print("  ✓ 关键词过滤 (TrendRadar风格)")
     print("  ✓ 文件缓存机制")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     # 1. 测试缓存管理器
     print("📦 测试 1: 缓存管理器")
-    print("-" * 80)
+    print(DIVIDER)
     cache_manager = get_cache_manager()
     cache_info = cache_manager.get_cache_info()
     print(f"✅ 缓存目录: {cache_info['cache_dir']}")
@@ -53,7 +55,7 @@ def test_integration():
 
     # 2. 测试关键词过滤
     print("🔍 测试 2: 关键词过滤")
-    print("-" * 80)
+    print(DIVIDER)
     keyword_filter = create_filter_from_string("Python +AI !GPU")
     print(f"✅ 过滤器: {keyword_filter}")
 
@@ -65,15 +67,14 @@ def test_integration():
     ]
 
     for title in test_titles:
-        matches = keyword_filter.matches(title)
-        score = keyword_filter.calculate_score(title) if matches else 0
+        matches, score = keyword_filter.match_and_score(title)
         status = "✅" if matches else "❌"
         print(f"{status} \"{title}\" - 匹配: {matches}, 分数: {score}")
     print()
 
     # 3. 测试多源爬虫（带缓存）
     print("🌐 测试 3: 多源爬虫系统")
-    print("-" * 80)
+    print(DIVIDER)
 
     config = CrawlerConfig(
         max_items=10,
@@ -99,7 +100,7 @@ def test_integration():
 
     # 4. 测试爬取（第一次 - 无缓存）
     print("⏱️  测试 4: 第一次爬取（无缓存）")
-    print("-" * 80)
+    print(DIVIDER)
 
     user_config = UserConfig(
         mode="job",
@@ -129,7 +130,7 @@ def test_integration():
 
     # 5. 测试缓存效果（第二次爬取）
     print("⚡ 测试 5: 第二次爬取（使用缓存）")
-    print("-" * 80)
+    print(DIVIDER)
 
     start_time = time.time()
     external_info2 = provider.retrieve_external_info(user_config)
@@ -150,7 +151,7 @@ def test_integration():
 
     # 6. 查看缓存统计
     print("📊 测试 6: 缓存统计")
-    print("-" * 80)
+    print(DIVIDER)
     cache_info = cache_manager.get_cache_info()
     print(f"总文件数: {cache_info['total_files']}")
     print(f"总大小: {cache_info['total_size_mb']} MB")
@@ -160,15 +161,15 @@ def test_integration():
 
     # 7. 测试不同领域
     print("🎯 测试 7: 多领域测试")
-    print("-" * 80)
+    print(DIVIDER)
 
     test_domains = [
         ("backend", "后端开发"),
         ("algorithm", "算法工程师"),
     ]
 
-    for domain, name in test_domains:
-        test_config = UserConfig(
+    test_configs = [
+        UserConfig(
             mode="job",
             domain=domain,
             target_position=name,
@@ -176,8 +177,19 @@ def test_integration():
             target_desc=f"希望了解{name}的最新技术趋势",
             resume_text="资深工程师"
         )
+        for domain, name in test_domains
+    ]
+
+    # 各领域并发检索，总耗时取决于最慢的领域
+    async def retrieve_all():
+        return await asyncio.gather(*[
+            provider.retrieve_external_info_async(test_config)
+            for test_config in test_configs
+        ])
+
+    results = asyncio.run(retrieve_all())
 
-        result = provider.retrieve_external_info(test_config)
+    for (domain, name), result in zip(test_domains, results):
         if result:
             jd_count = len(result.job_descriptions)
             exp_count = len(result.interview_experiences)
@@ -188,9 +200,9 @@ def test_integration():
     print()
 
     # 8. 总结
-    print("=" * 80)
+    print(BANNER)
     print("✨ 集成测试完成！")
-    print("=" * 80)
+    print(BANNER)
     print()
     print("📋 测试总结:")
     print("   ✅ 缓存机制工作正常")
@@ -2,23 +2,25 @@
 """
 测试 IT之家 API 爬虫
 """
-import sys
-from pathlib import Path
 
 # 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import _bootstrap  # noqa: F401
+from _output import print_items
 
 from app.sources.crawlers.ithome_api_crawler import ITHomeAPICrawler
 from app.sources.crawlers.models import CrawlerConfig
 
+# 输出分隔线
+BANNER = "=" * 80
+DIVIDER = "-" * 80
+
 
 def test_ithome_crawler():
     """测试IT之家爬虫"""
 
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试 IT之家 API 爬虫")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     # 创建配置
@@ -31,11 +33,18 @@ def test_ithome_crawler():
     # 创建爬虫实例
     crawler = ITHomeAPICrawler(config)
 
+    # 各领域共用同一份上游数据，只请求一次API（失败时各次crawl自行请求）
+    try:
+        raw = crawler.fetch_raw()
+    except Exception as e:
+        print(f"⚠️  预取API数据失败: {e}")
+        raw = None
+
     # 测试1: 不指定领域，获取所有技术相关新闻
     print("📋 测试 1: 获取所有技术相关新闻")
-    print("-" * 80)
+    print(DIVIDER)
 
-    result = crawler.crawl(domain="general", keywords=[])
+    result = crawler.crawl(domain="general", keywords=[], raw=raw)
 
     print(f"✅ 爬取状态: {'成功' if result.success else '失败'}")
     print(f"📊 获取条目: {len(result.items)} 条")
@@ -45,77 +54,60 @@ def test_ithome_crawler():
         print(f"❌ 错误信息: {result.error_message}")
 
     if result.items:
-        print()
-        print("📰 前5条科技新闻:")
-        for i, item in enumerate(result.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
-            print(f"   类型: {item.metadata.get('content_type', 'news')}")
+        print_items("📰 前5条科技新闻:", result.items, type_default='news')
 
     print()
-    print("=" * 80)
+    print(BANNER)
 
     # 测试2: 指定LLM应用领域
     print("📋 测试 2: LLM应用领域相关新闻")
-    print("-" * 80)
+    print(DIVIDER)
 
-    result_llm = crawler.crawl(domain='llm_application', keywords=[])
+    result_llm = crawler.crawl(domain='llm_application', keywords=[], raw=raw)
 
     print(f"✅ 爬取状态: {'成功' if result_llm.success else '失败'}")
     print(f"📊 获取条目: {len(result_llm.items)} 条")
     print(f"⏱️  耗时: {result_llm.duration_ms}ms")
 
     if result_llm.items:
-        print()
-        print("📰 LLM相关新闻:")
-        for i, item in enumerate(result_llm.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
+        print_items("📰 LLM相关新闻:", result_llm.items)
 
     print()
-    print("=" * 80)
+    print(BANNER)
 
     # 测试3: 指定后端领域
     print("📋 测试 3: 后端开发领域相关新闻")
-    print("-" * 80)
+    print(DIVIDER)
 
-    result_backend = crawler.crawl(domain='backend', keywords=[])
+    result_backend = crawler.crawl(domain='backend', keywords=[], raw=raw)
 
     print(f"✅ 爬取状态: {'成功' if result_backend.success else '失败'}")
     print(f"📊 获取条目: {len(result_backend.items)} 条")
     print(f"⏱️  耗时: {result_backend.duration_ms}ms")
 
     if result_backend.items:
-        print()
-        print("📰 后端相关新闻:")
-        for i, item in enumerate(result_backend.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
+        print_items("📰 后端相关新闻:", result_backend.items)
 
     print()
-    print("=" * 80)
+    print(BANNER)
 
     # 测试4: 硬件/产品领域 (IT之家特色)
     print("📋 测试 4: 硬件/产品相关新闻")
-    print("-" * 80)
+    print(DIVIDER)
 
-    result_mobile = crawler.crawl(domain='mobile', keywords=[])
+    result_mobile = crawler.crawl(domain='mobile', keywords=[], raw=raw)
 
     print(f"✅ 爬取状态: {'成功' if result_mobile.success else '失败'}")
     print(f"📊 获取条目: {len(result_mobile.items)} 条")
     print(f"⏱️  耗时: {result_mobile.duration_ms}ms")
 
     if result_mobile.items:
-        print()
-        print("📰 硬件/产品相关新闻:")
-        for i, item in enumerate(result_mobile.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
+        print_items("📰 硬件/产品相关新闻:", result_mobile.items)
 
     print()
-    print("=" * 80)
+    print(BANNER)
     print("📊 测试总结")
-    print("=" * 80)
+    print(BANNER)
 
     print(f"总技术新闻: {len(result.items)} 条")
     print(f"LLM应用: {len(result_llm.items)} 条")
@@ -2,21 +2,21 @@
 """
 测试关键词过滤器
 """
-import sys
-from pathlib import Path
 
 # 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import _bootstrap  # noqa: F401
 
 from app.sources.crawlers.keyword_filter import KeywordFilter, create_filter_from_string
 
+# 输出分隔线
+BANNER = "=" * 80
+
 
 def test_basic_filtering():
     """测试基本过滤功能"""
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试1: 基本过滤功能")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     # 创建过滤器: 必须有"后端", 不能有"前端", 可选"Python"
@@ -42,9 +42,9 @@ def test_basic_filtering():
 
 def test_scoring():
     """测试评分功能"""
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试2: 评分功能")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     filter2 = KeywordFilter(["Python", "Django", "+后端", "!前端"])
@@ -67,9 +67,9 @@ def test_scoring():
 
 def test_string_parsing():
     """测试字符串解析"""
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试3: 字符串解析")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     test_string = "Python +后端 !前端 Django,Flask"
@@ -80,17 +80,17 @@ def test_string_parsing():
     print(f"解析结果: {filter3}")
     print()
 
-    print(f"普通关键词: {filter3.normal_keywords}")
-    print(f"必须关键词: {filter3.required_keywords}")
-    print(f"排除关键词: {filter3.exclude_keywords}")
+    print(f"普通关键词: {set(filter3.normal_keywords)}")
+    print(f"必须关键词: {set(filter3.required_keywords)}")
+    print(f"排除关键词: {set(filter3.exclude_keywords)}")
     print()
 
 
 def test_filter_items():
     """测试批量过滤和排序"""
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试4: 批量过滤和排序")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     items = [
@@ -122,9 +122,9 @@ def test_filter_items():
 
 def test_llm_domain():
     """测试LLM领域过滤"""
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试5: LLM领域过滤")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     # LLM领域：必须有AI相关，排除硬件
@@ -154,9 +154,9 @@ def test_llm_domain():
 
 def test_empty_filter():
     """测试空过滤器"""
-    print("=" * 80)
+    print(BANNER)
     print("🧪 测试6: 空过滤器")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     filter6 = KeywordFilter([])
@@ -182,9 +182,9 @@ def run_all_tests():
     test_llm_domain()
     test_empty_filter()
 
-    print("=" * 80)
+    print(BANNER)
     print("✨ 所有测试完成！")
-    print("=" * 80)
+    print(BANNER)
     print()
     print("💡 关键词过滤语法:")
     print("   - normal_word: 普通关键词（可选，增加相关性分数）")
@@ -2,20 +2,98 @@
 """
 测试多源爬虫系统 V3 - GitHub + V2EX
 """
-import sys
-from pathlib import Path
+import argparse
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, List, Optional
 
 # 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import _bootstrap  # noqa: F401
+from _output import make_line_collector
+
+# 爬虫和模型模块在实际运行测试时才导入，--help 或参数错误时无需加载整个应用
+if TYPE_CHECKING:
+    from app.sources.multi_source_provider import MultiSourceCrawlerProvider
+
+# 与 app.core.logging 相同的调试开关
+DEBUG_ENV_VAR = "GRILLRADAR_DEBUG"
+
+# 测试领域: (领域, 目标职位)
+TEST_DOMAINS = [
+    ('llm_application', 'LLM应用工程师'),
+    ('backend', '后端开发工程师'),
+    ('algorithm', '算法工程师'),
+]
+
+
+def _run_domain(
+    provider: "MultiSourceCrawlerProvider",
+    domain: str,
+    position: str
+) -> List[str]:
+    """检索单个领域的外部信息，收集其输出行（并行执行时避免输出交错）"""
+    from app.models.user_config import UserConfig
+
+    log, lines = make_line_collector()
+
+    log("=" * 80)
+    log(f"🔍 测试领域: {domain} ({position})")
+    log("=" * 80)
+
+    user_config = UserConfig(
+        mode="job",
+        domain=domain,
+        target_position=position,
+        target_company="字节跳动",
+        target_desc=f"我想应聘{position}职位，希望能够得到相关的面试指导和准备建议",
+        resume_text="资深工程师，具有5年以上项目经验，熟悉主流技术栈"
+    )
+
+    try:
+        external_info = provider.retrieve_external_info(user_config)
+
+        if external_info:
+            log(f"✅ 获取成功!")
+            log()
+
+            # 显示摘要内容（前800字符）
+            log(f"📝 摘要预览:")
+            log("-" * 80)
+            if hasattr(external_info, 'summary') and external_info.summary:
+                summary_preview = external_info.summary[:800]
+                log(summary_preview)
+                if len(external_info.summary) > 800:
+                    log("...")
+            else:
+                log("（无摘要内容）")
+            log("-" * 80)
+            log()
+
+        else:
+            log(f"❌ 获取失败 - 返回 None")
 
-from app.sources.multi_source_provider import MultiSourceCrawlerProvider
-from app.sources.crawlers.models import CrawlerConfig
-from app.models.user_config import UserConfig
+    except Exception as e:
+        log(f"❌ 测试失败: {e}")
+        # 完整堆栈需要逐帧读取源码，仅在调试模式（GRILLRADAR_DEBUG=1）下输出
+        if os.getenv(DEBUG_ENV_VAR, "").lower() in ("1", "true", "yes"):
+            log(traceback.format_exc())
+        else:
+            log("".join(traceback.format_exception_only(type(e), e)).rstrip())
 
+    log()
+    return lines
 
-def test_multi_source_v3():
-    """测试多源爬虫系统 V3 - GitHub + V2EX"""
+
+def test_multi_source_v3(domains: Optional[List[str]] = None):
+    """
+    测试多源爬虫系统 V3 - GitHub + V2EX
+
+    Args:
+        domains: 要测试的领域（默认测试TEST_DOMAINS中的全部领域）
+    """
+    from app.sources.multi_source_provider import MultiSourceCrawlerProvider
+    from app.sources.crawlers.models import CrawlerConfig
 
     print("=" * 80)
     print("🚀 测试多源爬虫系统 V4 (GitHub + V2EX + IT之家)")
@@ -50,54 +128,18 @@ def test_multi_source_v3():
 
     # 测试不同领域
     test_domains = [
-        ('llm_application', 'LLM应用工程师'),
-        ('backend', '后端开发工程师'),
-        ('algorithm', '算法工程师'),
+        (domain, position) for domain, position in TEST_DOMAINS
+        if not domains or domain in domains
     ]
 
-    for domain, position in test_domains:
-        print("=" * 80)
-        print(f"🔍 测试领域: {domain} ({position})")
-        print("=" * 80)
-
-        user_config = UserConfig(
-            mode="job",
-            domain=domain,
-            target_position=position,
-            target_company="字节跳动",
-            target_desc=f"我想应聘{position}职位，希望能够得到相关的面试指导和准备建议",
-            resume_text="资深工程师，具有5年以上项目经验，熟悉主流技术栈"
-        )
-
-        try:
-            external_info = provider.retrieve_external_info(user_config)
-
-            if external_info:
-                print(f"✅ 获取成功!")
-                print()
-
-                # 显示摘要内容（前800字符）
-                print(f"📝 摘要预览:")
-                print("-" * 80)
-                if hasattr(external_info, 'summary') and external_info.summary:
-                    summary_preview = external_info.summary[:800]
-                    print(summary_preview)
-                    if len(external_info.summary) > 800:
-                        print("...")
-                else:
-                    print("（无摘要内容）")
-                print("-" * 80)
-                print()
-
-            else:
-                print(f"❌ 获取失败 - 返回 None")
-
-        except Exception as e:
-            print(f"❌ 测试失败: {e}")
-            import traceback
-            traceback.print_exc()
-
-        print()
+    # 各领域检索相互独立（均为网络I/O），并行执行，先完成的领域先输出
+    with ThreadPoolExecutor(max_workers=len(test_domains)) as executor:
+        futures = [
+            executor.submit(_run_domain, provider, domain, position)
+            for domain, position in test_domains
+        ]
+        for future in as_completed(futures):
+            print("\n".join(future.result()))
 
     print("=" * 80)
     print("✨ 测试完成！")
@@ -111,5 +153,29 @@ def test_multi_source_v3():
     print()
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="测试多源爬虫系统（GitHub + V2EX + IT之家）",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  # 测试全部领域（并行）
+  python scripts/test_multi_source_v3.py
+
+  # 只测试指定领域
+  python scripts/test_multi_source_v3.py --domain backend --domain algorithm
+        """
+    )
+    parser.add_argument(
+        '--domain',
+        action='append',
+        choices=[domain for domain, _ in TEST_DOMAINS],
+        help='要测试的领域，可重复指定（默认全部）'
+    )
+
+    args = parser.parse_args()
+    test_multi_source_v3(domains=args.domain)
+
+
 if __name__ == "__main__":
-    test_multi_source_v3()
+    main()
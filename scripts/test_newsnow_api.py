@@ -3,82 +3,166 @@
 测试 newsnow API - 探索TrendRadar使用的API接口
 参考项目: https://github.com/sansan0/TrendRadar
 """
-import requests
+import asyncio
+import random
+import re
 import json
-from typing import Dict, Any
-
-
-def test_newsnow_api(platform_id: str, platform_name: str) -> Dict[str, Any]:
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+
+from _output import make_line_collector
+
+try:
+    import orjson
+except ImportError:  # 可选依赖：未安装时回退到标准库json
+    orjson = None
+
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+    "Cache-Control": "no-cache",
+}
+
+# 所有平台都请求同一主机，共用一个客户端连接池以复用 keep-alive 连接
+LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+
+# 限流/服务端错误时的重试策略
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 10
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 技术相关关键词
+TECH_KEYWORDS = frozenset({
+    "AI", "人工智能", "ChatGPT", "大模型", "LLM", "机器学习",
+    "深度学习", "算法", "Python", "Java", "开发", "编程",
+    "技术", "代码", "GitHub", "开源"
+})
+
+# 所有关键词合并为一个正则（忽略大小写），每个标题只需扫描一遍；
+# 英文关键词前后不能紧邻英文字母（避免 "AI" 命中 "said"/"email"，
+# 又不像 \b 那样排斥紧邻的中文），中文关键词按子串匹配
+TECH_KEYWORDS_RE = re.compile(
+    "|".join(
+        rf"(?<![A-Za-z]){re.escape(keyword)}(?![A-Za-z])" if keyword.isascii() else re.escape(keyword)
+        for keyword in TECH_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    log: Callable[..., None] = print
+) -> httpx.Response:
+    """请求接口，遇到429/5xx或网络错误时按指数退避（带随机抖动）重试"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retryable = (
+                not isinstance(e, httpx.HTTPStatusError)
+                or e.response.status_code in RETRY_STATUS_CODES
+            )
+            if not retryable or attempt == MAX_RETRIES - 1:
+                raise
+
+            wait_time = min(2 ** attempt, MAX_RETRY_DELAY) + random.uniform(0, 1)
+            log(f"⚠️  请求失败 (重试 {attempt + 1}/{MAX_RETRIES}): {e}. {wait_time:.1f}秒后重试...")
+            await asyncio.sleep(wait_time)
+
+
+async def test_newsnow_api(
+    client: httpx.AsyncClient,
+    platform_id: str,
+    platform_name: str,
+    log: Callable[..., None] = print
+) -> Dict[str, Any]:
     """测试 newsnow API"""
     url = f"https://newsnow.busiyi.world/api/s?id={platform_id}&latest"
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Connection": "keep-alive",
-        "Cache-Control": "no-cache",
-    }
-
-    print("=" * 80)
-    print(f"🔍 测试平台: {platform_name} ({platform_id})")
-    print("=" * 80)
-    print(f"URL: {url}")
-    print()
+    log("=" * 80)
+    log(f"🔍 测试平台: {platform_name} ({platform_id})")
+    log("=" * 80)
+    log(f"URL: {url}")
+    log()
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = await _get_with_retry(client, url, log=log)
 
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
 
         status = data.get("status", "未知")
         items = data.get("items", [])
 
-        print(f"✅ 状态: {status}")
-        print(f"📊 条目数: {len(items)}")
-        print()
+        log(f"✅ 状态: {status}")
+        log(f"📊 条目数: {len(items)}")
+        log()
 
         # 显示前5条新闻
-        print("📰 前5条新闻:")
-        print("-" * 80)
+        log("📰 前5条新闻:")
+        log("-" * 80)
         for i, item in enumerate(items[:5], 1):
             title = item.get("title", "")
             url_link = item.get("url", "")
-            print(f"{i}. {title}")
-            print(f"   链接: {url_link}")
-            print()
+            log(f"{i}. {title}")
+            log(f"   链接: {url_link}")
+            log()
 
         # 分析技术相关内容
-        tech_keywords = [
-            "AI", "人工智能", "ChatGPT", "大模型", "LLM", "机器学习",
-            "深度学习", "算法", "Python", "Java", "开发", "编程",
-            "技术", "代码", "GitHub", "开源"
+        tech_items = [
+            item.get("title", "") for item in items
+            if TECH_KEYWORDS_RE.search(item.get("title", ""))
         ]
+        tech_count = len(tech_items)
 
-        tech_count = 0
-        tech_items = []
-        for item in items:
-            title = item.get("title", "")
-            if any(keyword in title for keyword in tech_keywords):
-                tech_count += 1
-                tech_items.append(title)
-
-        print("-" * 80)
-        print(f"🔧 技术相关新闻: {tech_count}/{len(items)}")
+        log("-" * 80)
+        log(f"🔧 技术相关新闻: {tech_count}/{len(items)}")
         if tech_items:
-            print("技术相关标题示例:")
+            log("技术相关标题示例:")
             for title in tech_items[:3]:
-                print(f"  - {title}")
-        print()
+                log(f"  - {title}")
+        log()
 
         return data
 
     except Exception as e:
-        print(f"❌ 请求失败: {e}")
+        log(f"❌ 请求失败: {e}")
         return {}
 
 
+async def _probe_platform(
+    client: httpx.AsyncClient,
+    platform: Tuple[str, str]
+) -> Tuple[str, Dict[str, Any], List[str]]:
+    """探测单个平台，收集其输出行（并发执行时避免输出交错）"""
+    log, lines = make_line_collector()
+
+    data = await test_newsnow_api(client, *platform, log=log)
+    return platform[0], data, lines
+
+
+async def _probe_all(platforms: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+    """并发探测所有平台，每个平台完成后立即输出其结果"""
+    results = {}
+
+    async with httpx.AsyncClient(headers=HEADERS, limits=LIMITS, timeout=10) as client:
+        probes = [_probe_platform(client, platform) for platform in platforms]
+        for probe in asyncio.as_completed(probes):
+            platform_id, data, lines = await probe
+            print("\n".join(lines))
+            print()
+            results[platform_id] = data
+
+    return results
+
+
 def main():
     """主函数 - 测试多个平台"""
 
@@ -98,12 +182,8 @@ def main():
     print("=" * 80)
     print()
 
-    results = {}
-
-    for platform_id, platform_name in platforms:
-        data = test_newsnow_api(platform_id, platform_name)
-        results[platform_id] = data
-        print()
+    # 各平台请求相互独立，在同一个异步客户端上并发发出，按完成顺序输出
+    results = asyncio.run(_probe_all(platforms))
 
     print("=" * 80)
     print("📋 测试总结")
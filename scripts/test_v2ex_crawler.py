@@ -2,12 +2,11 @@
 """
 测试 V2EX API 爬虫
 """
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根目录到路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import _bootstrap  # noqa: F401
+from _output import print_items
 
 from app.sources.crawlers.v2ex_api_crawler import V2EXAPICrawler
 from app.sources.crawlers.models import CrawlerConfig
@@ -31,12 +30,18 @@ def test_v2ex_crawler():
     # 创建爬虫实例
     crawler = V2EXAPICrawler(config)
 
+    # 四个领域的请求相互独立，并行发出后再依次输出
+    domains = ["general", "llm_application", "backend", "algorithm"]
+    with ThreadPoolExecutor(max_workers=len(domains)) as executor:
+        result, result_llm, result_backend, result_algo = executor.map(
+            lambda domain: crawler.crawl(domain=domain, keywords=[]),
+            domains
+        )
+
     # 测试1: 不指定领域，获取所有技术相关内容
     print("📋 测试 1: 获取所有技术相关讨论")
     print("-" * 80)
 
-    result = crawler.crawl(domain="general", keywords=[])
-
     print(f"✅ 爬取状态: {'成功' if result.success else '失败'}")
     print(f"📊 获取条目: {len(result.items)} 条")
 
@@ -44,12 +49,7 @@ def test_v2ex_crawler():
         print(f"❌ 错误信息: {result.error_message}")
 
     if result.items:
-        print()
-        print("📰 前5条技术讨论:")
-        for i, item in enumerate(result.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
-            print(f"   类型: {item.metadata.get('content_type', 'discussion')}")
+        print_items("📰 前5条技术讨论:", result.items, type_default='discussion')
 
     print()
     print("=" * 80)
@@ -58,17 +58,11 @@ def test_v2ex_crawler():
     print("📋 测试 2: LLM应用领域相关讨论")
     print("-" * 80)
 
-    result_llm = crawler.crawl(domain='llm_application', keywords=[])
-
     print(f"✅ 爬取状态: {'成功' if result_llm.success else '失败'}")
     print(f"📊 获取条目: {len(result_llm.items)} 条")
 
     if result_llm.items:
-        print()
-        print("📰 LLM相关讨论:")
-        for i, item in enumerate(result_llm.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
+        print_items("📰 LLM相关讨论:", result_llm.items)
 
     print()
     print("=" * 80)
@@ -77,17 +71,11 @@ def test_v2ex_crawler():
     print("📋 测试 3: 后端开发领域相关讨论")
     print("-" * 80)
 
-    result_backend = crawler.crawl(domain='backend', keywords=[])
-
     print(f"✅ 爬取状态: {'成功' if result_backend.success else '失败'}")
     print(f"📊 获取条目: {len(result_backend.items)} 条")
 
     if result_backend.items:
-        print()
-        print("📰 后端相关讨论:")
-        for i, item in enumerate(result_backend.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
+        print_items("📰 后端相关讨论:", result_backend.items)
 
     print()
     print("=" * 80)
@@ -96,17 +84,11 @@ def test_v2ex_crawler():
     print("📋 测试 4: 算法/面试相关讨论")
     print("-" * 80)
 
-    result_algo = crawler.crawl(domain='algorithm', keywords=[])
-
     print(f"✅ 爬取状态: {'成功' if result_algo.success else '失败'}")
     print(f"📊 获取条目: {len(result_algo.items)} 条")
 
     if result_algo.items:
-        print()
-        print("📰 算法/面试相关讨论:")
-        for i, item in enumerate(result_algo.items[:5], 1):
-            print(f"\n{i}. {item.title}")
-            print(f"   链接: {item.url}")
+        print_items("📰 算法/面试相关讨论:", result_algo.items)
 
     print()
     print("=" * 80)
@@ -4,6 +4,7 @@ GrillRadar 配置向导
 交互式配置工具，帮助用户快速完成环境配置
 """
 import os
+import stat
 import sys
 from pathlib import Path
 from typing import Optional
@@ -20,37 +21,55 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# 预先拼接的样式前缀和分隔线
+_BANNER = '=' * 60
+_HEADER_STYLE = f"{Colors.HEADER}{Colors.BOLD}"
+_BANNER_LINE = f"{_HEADER_STYLE}{_BANNER}{Colors.ENDC}\n"
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✓ "
+_WARNING_PREFIX = f"{Colors.WARNING}⚠ "
+_ERROR_PREFIX = f"{Colors.FAIL}✗ "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ "
+
 def print_header(text: str):
     """打印标题"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text:^60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}\n")
+    sys.stdout.write(f"\n{_BANNER_LINE}{_HEADER_STYLE}{text:^60}{Colors.ENDC}\n{_BANNER_LINE}\n")
+    sys.stdout.flush()
 
 def print_success(text: str):
     """打印成功消息"""
-    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_SUCCESS_PREFIX}{text}{Colors.ENDC}\n")
 
 def print_warning(text: str):
     """打印警告消息"""
-    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_WARNING_PREFIX}{text}{Colors.ENDC}\n")
 
 def print_error(text: str):
     """打印错误消息"""
-    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_ERROR_PREFIX}{text}{Colors.ENDC}\n")
+
+def print_info(*lines: str):
+    """打印信息（多行时拼接后一次输出）"""
+    sys.stdout.write("".join(f"{_INFO_PREFIX}{text}{Colors.ENDC}\n" for text in lines))
 
-def print_info(text: str):
-    """打印信息"""
-    print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
+def _read_line(prompt_text: str) -> str:
+    """输出提示并从标准输入读取一行（EOF 时与 input() 一样抛出 EOFError）"""
+    sys.stdout.write(prompt_text)
+    sys.stdout.flush()
+
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
 
 def get_input(prompt: str, default: Optional[str] = None, required: bool = False) -> str:
     """获取用户输入"""
     if default:
-        prompt_text = f"{prompt} [{default}]: "
+        prompt_text = f"{Colors.OKBLUE}{prompt} [{default}]: {Colors.ENDC}"
     else:
-        prompt_text = f"{prompt}: "
+        prompt_text = f"{Colors.OKBLUE}{prompt}: {Colors.ENDC}"
 
     while True:
-        value = input(f"{Colors.OKBLUE}{prompt_text}{Colors.ENDC}").strip()
+        value = _read_line(prompt_text)
 
         if not value and default:
             return default
@@ -63,13 +82,18 @@ def get_input(prompt: str, default: Optional[str] = None, required: bool = False
 
 def get_choice(prompt: str, choices: list, default: Optional[str] = None) -> str:
     """获取用户选择"""
-    print(f"\n{Colors.OKBLUE}{prompt}{Colors.ENDC}")
+    # 选项列表只输出一次，输入无效时仅重复提示行
+    lines = [f"\n{Colors.OKBLUE}{prompt}{Colors.ENDC}\n"]
     for i, choice in enumerate(choices, 1):
         marker = f" (默认)" if choice == default else ""
-        print(f"  {i}. {choice}{marker}")
+        lines.append(f"  {i}. {choice}{marker}\n")
+    sys.stdout.write("".join(lines))
+
+    prompt_text = f"{Colors.OKBLUE}请选择 [1-{len(choices)}]: {Colors.ENDC}"
+    hint = f"请输入 1-{len(choices)} 之间的数字"
 
     while True:
-        choice_input = input(f"{Colors.OKBLUE}请选择 [1-{len(choices)}]: {Colors.ENDC}").strip()
+        choice_input = _read_line(prompt_text)
 
         if not choice_input and default:
             return default
@@ -81,7 +105,7 @@ def get_choice(prompt: str, choices: list, default: Optional[str] = None) -> str
         except ValueError:
             pass
 
-        print_warning(f"请输入 1-{len(choices)} 之间的数字")
+        print_warning(hint)
 
 def detect_existing_config() -> Optional[Path]:
     """检测现有配置"""
@@ -90,51 +114,96 @@ def detect_existing_config() -> Optional[Path]:
         return env_file
     return None
 
+def _render_anthropic_block(config: dict) -> str:
+    """生成 Anthropic API 配置段"""
+    if config.get('use_third_party'):
+        return (
+            "# 使用第三方 Anthropic 兼容服务\n"
+            f"ANTHROPIC_AUTH_TOKEN={config['anthropic_token']}\n"
+            f"ANTHROPIC_BASE_URL={config['anthropic_base_url']}\n\n"
+        )
+    return (
+        "# 使用官方 Anthropic API\n"
+        f"ANTHROPIC_API_KEY={config['anthropic_api_key']}\n\n"
+    )
+
+def _render_openai_block(config: dict) -> str:
+    """生成 OpenAI API 配置段"""
+    return (
+        "# 使用 OpenAI API\n"
+        f"OPENAI_API_KEY={config['openai_api_key']}\n\n"
+    )
+
+# 各 LLM 提供商的 API 配置段生成函数
+PROVIDER_BLOCK_RENDERERS = {
+    'anthropic': _render_anthropic_block,
+    'openai': _render_openai_block,
+}
+
+# .env 中可选项的默认值
+ENV_DEFAULTS = {
+    'temperature': '0.7',
+    'max_tokens': '16000',
+    'timeout': '120',
+    'app_name': 'GrillRadar',
+    'app_version': '1.0.0',
+    'debug': 'False',
+}
+
 def create_env_file(config: dict):
     """创建 .env 文件"""
     env_file = Path(".env")
+    config = {**ENV_DEFAULTS, **config}
 
-    with open(env_file, 'w', encoding='utf-8') as f:
-        f.write("# GrillRadar 环境配置\n")
-        f.write("# 由配置向导自动生成\n\n")
+    render_provider_block = PROVIDER_BLOCK_RENDERERS.get(config['llm_provider'])
+
+    # 拼接完整内容后一次写入
+    parts = [
+        "# GrillRadar 环境配置\n",
+        "# 由配置向导自动生成\n\n",
 
         # LLM 配置
-        f.write("# ======================\n")
-        f.write("# LLM API 配置\n")
-        f.write("# ======================\n\n")
-
-        if config['llm_provider'] == 'anthropic':
-            if config.get('use_third_party'):
-                f.write("# 使用第三方 Anthropic 兼容服务\n")
-                f.write(f"ANTHROPIC_AUTH_TOKEN={config['anthropic_token']}\n")
-                f.write(f"ANTHROPIC_BASE_URL={config['anthropic_base_url']}\n\n")
-            else:
-                f.write("# 使用官方 Anthropic API\n")
-                f.write(f"ANTHROPIC_API_KEY={config['anthropic_api_key']}\n\n")
-        elif config['llm_provider'] == 'openai':
-            f.write("# 使用 OpenAI API\n")
-            f.write(f"OPENAI_API_KEY={config['openai_api_key']}\n\n")
+        "# ======================\n",
+        "# LLM API 配置\n",
+        "# ======================\n\n",
+        render_provider_block(config) if render_provider_block else "",
 
         # LLM 参数
-        f.write("# LLM 参数配置\n")
-        f.write(f"DEFAULT_LLM_PROVIDER={config['llm_provider']}\n")
-        f.write(f"DEFAULT_MODEL={config['llm_model']}\n")
-        f.write(f"LLM_TEMPERATURE={config.get('temperature', '0.7')}\n")
-        f.write(f"LLM_MAX_TOKENS={config.get('max_tokens', '16000')}\n")
-        f.write(f"LLM_TIMEOUT={config.get('timeout', '120')}\n\n")
+        "# LLM 参数配置\n",
+        f"DEFAULT_LLM_PROVIDER={config['llm_provider']}\n",
+        f"DEFAULT_MODEL={config['llm_model']}\n",
+        f"LLM_TEMPERATURE={config['temperature']}\n",
+        f"LLM_MAX_TOKENS={config['max_tokens']}\n",
+        f"LLM_TIMEOUT={config['timeout']}\n\n",
 
         # 应用配置
-        f.write("# ======================\n")
-        f.write("# 应用配置\n")
-        f.write("# ======================\n\n")
-        f.write(f"APP_NAME={config.get('app_name', 'GrillRadar')}\n")
-        f.write(f"APP_VERSION={config.get('app_version', '1.0.0')}\n")
-        f.write(f"DEBUG={config.get('debug', 'False')}\n")
+        "# ======================\n",
+        "# 应用配置\n",
+        "# ======================\n\n",
+        f"APP_NAME={config['app_name']}\n",
+        f"APP_VERSION={config['app_version']}\n",
+        f"DEBUG={config['debug']}\n",
+    ]
+
+    # 先写临时文件再原子替换，写入中途失败不会留下残缺的 .env
+    # .env 含 API 密钥：临时文件以 600 创建，已有 .env 时沿用其原有权限
+    tmp_file = env_file.with_name(env_file.name + ".tmp")
+    tmp_file.unlink(missing_ok=True)
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write("".join(parts).encode('utf-8'))
+        if env_file.exists():
+            os.chmod(tmp_file, stat.S_IMODE(env_file.stat().st_mode))
+        os.replace(tmp_file, env_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
     print_success(f"配置文件已创建: {env_file.absolute()}")
 
-def setup_wizard():
-    """配置向导主流程"""
+def _run_setup_wizard():
+    """配置向导各步骤"""
     print_header("GrillRadar 配置向导")
 
     # 检测现有配置
@@ -154,9 +223,11 @@ def setup_wizard():
 
     # 1. 选择 LLM 提供商
     print_header("步骤 1/4: 选择 LLM 提供商")
-    print_info("GrillRadar 支持以下 LLM 提供商：")
-    print_info("  • Anthropic Claude (推荐) - 强大的推理能力")
-    print_info("  • OpenAI GPT - 广泛使用的模型")
+    print_info(
+        "GrillRadar 支持以下 LLM 提供商：",
+        "  • Anthropic Claude (推荐) - 强大的推理能力",
+        "  • OpenAI GPT - 广泛使用的模型"
+    )
 
     llm_provider = get_choice(
         "请选择 LLM 提供商",
@@ -169,9 +240,11 @@ def setup_wizard():
     print_header("步骤 2/4: 配置 API 密钥")
 
     if llm_provider == "anthropic":
-        print_info("Anthropic API 配置方式：")
-        print_info("  1. 官方 API: https://console.anthropic.com/")
-        print_info("  2. 第三方兼容服务: 如 BigModel (智谱AI)")
+        print_info(
+            "Anthropic API 配置方式：",
+            "  1. 官方 API: https://console.anthropic.com/",
+            "  2. 第三方兼容服务: 如 BigModel (智谱AI)"
+        )
 
         use_official = get_choice(
             "使用哪种方式？",
@@ -188,9 +261,11 @@ def setup_wizard():
             config['anthropic_api_key'] = api_key
         else:
             config['use_third_party'] = True
-            print_info("\n第三方服务配置（以 BigModel 为例）：")
-            print_info("  注册: https://open.bigmodel.cn/")
-            print_info("  获取 Auth Token 后填入下方")
+            print_info(
+                "\n第三方服务配置（以 BigModel 为例）：",
+                "  注册: https://open.bigmodel.cn/",
+                "  获取 Auth Token 后填入下方"
+            )
 
             auth_token = get_input(
                 "请输入 Auth Token",
@@ -205,8 +280,10 @@ def setup_wizard():
             config['anthropic_base_url'] = base_url
 
     else:  # OpenAI
-        print_info("OpenAI API 配置:")
-        print_info("  获取 API Key: https://platform.openai.com/api-keys")
+        print_info(
+            "OpenAI API 配置:",
+            "  获取 API Key: https://platform.openai.com/api-keys"
+        )
 
         api_key = get_input(
             "请输入 OpenAI API Key",
@@ -285,13 +362,32 @@ def setup_wizard():
     # 完成
     print_header("配置完成")
     print_success("GrillRadar 配置已完成！")
-    print_info("\n下一步：")
-    print_info("  1. 启动应用: python -m uvicorn app.main:app --reload")
-    print_info("  2. 访问文档: http://localhost:8000/docs")
-    print_info("  3. 查看示例: examples/")
-    print_info("\n如需修改配置，可以：")
-    print_info("  • 重新运行此向导: python setup_config.py")
-    print_info("  • 手动编辑: .env 文件")
+    print_info(
+        "\n下一步：",
+        "  1. 启动应用: python -m uvicorn app.main:app --reload",
+        "  2. 访问文档: http://localhost:8000/docs",
+        "  3. 查看示例: examples/",
+        "\n如需修改配置，可以：",
+        "  • 重新运行此向导: python setup_config.py",
+        "  • 手动编辑: .env 文件"
+    )
+    sys.stdout.flush()
+
+def setup_wizard():
+    """配置向导主流程"""
+    if not hasattr(sys.stdout, 'reconfigure'):
+        _run_setup_wizard()
+        return
+
+    # 向导运行期间关闭行缓冲，说明文字攒批输出；标题和输入提示处会显式 flush
+    # 结束后恢复原设置，不影响进程中的其他输出
+    line_buffering = sys.stdout.line_buffering
+    write_through = sys.stdout.write_through
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    try:
+        _run_setup_wizard()
+    finally:
+        sys.stdout.reconfigure(line_buffering=line_buffering, write_through=write_through)
 
 def quick_test():
     """快速测试配置"""
@@ -301,7 +397,8 @@ def quick_test():
         from dotenv import load_dotenv
         load_dotenv()
 
-        from app.config.settings import settings
+        from app.config.settings import get_settings
+        settings = get_settings()
 
         print_info("当前配置：")
         print(f"  • LLM Provider: {settings.DEFAULT_LLM_PROVIDER}")
@@ -324,8 +421,8 @@ def quick_test():
     except Exception as e:
         print_error(f"配置测试失败: {e}")
 
-def main():
-    """主函数"""
+def _build_parser():
+    """构建命令行参数解析器"""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -343,10 +440,21 @@ def main():
         action='store_true',
         help='测试当前配置'
     )
+    return parser
 
-    args = parser.parse_args()
+def main():
+    """主函数"""
+    argv = sys.argv[1:]
+
+    # 无参数和单独的 --test 是最常见的两种调用，无需构建 argparse 解析器
+    if not argv:
+        test = False
+    elif argv == ['--test']:
+        test = True
+    else:
+        test = _build_parser().parse_args(argv).test
 
-    if args.test:
+    if test:
         quick_test()
     else:
         try:
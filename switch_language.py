@@ -10,6 +10,7 @@ GrillRadar 语言切换工具 / Language Switcher Utility
     python switch_language.py       # 显示当前语言 / Show current language
 """
 import os
+import re
 import shutil
 import sys
 from pathlib import Path
@@ -39,12 +40,65 @@ DOCS = {
     }
 }
 
+# 中文字符检测（直接匹配 U+4E00..U+9FFF 的 UTF-8 字节，无需解码）
+# CJK character detection on raw UTF-8 bytes of U+4E00..U+9FFF (no decoding)
+CJK_RE = re.compile(rb'\xe4[\xb8-\xbf][\x80-\xbf]|[\xe5-\xe9][\x80-\xbf]{2}')
+
+# 记录当前语言的标记文件（内容为语言代码首字母）
+# Sentinel file recording the current language (first letter of the code)
+LANG_SENTINEL = '.docs_lang'
+SENTINEL_LANGS = {b'z': 'zh', b'e': 'en'}
+
 # 语言显示名称 / Language display names
 LANG_NAMES = {
     'zh': '中文 (Chinese)',
     'en': 'English'
 }
 
+# 按语言预先展开的 (主文件名, 源文件名) 列表
+# Per-language (main file, source file) pairs, flattened once at import
+DOC_PAIRS = {
+    lang: tuple((doc_name, lang_files[lang]) for doc_name, lang_files in DOCS.items())
+    for lang in LANG_NAMES
+}
+
+
+def list_existing_files(directory='.'):
+    """
+    一次性列出目录中的文件名 / List file names in a directory at once
+
+    用一次目录扫描代替逐个文件的 exists() 检查
+    One directory scan instead of an exists() call per file
+
+    Returns:
+        set of file names
+    """
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+def copy_replace(source, target):
+    """
+    复制文件并原子替换目标文件 / Copy a file and atomically replace the target
+
+    先复制到临时文件再用 os.replace 替换，避免中途失败留下半个文件；
+    使用独立副本，修改主文件不会影响源语言文件
+    Copies to a temporary name first and swaps it in with os.replace; the
+    result is an independent copy, so editing it never touches the source
+
+    Args:
+        source: 源文件 / source file
+        target: 目标文件 / target file
+    """
+    tmp_path = f"{target}.tmp"
+    try:
+        shutil.copy(source, tmp_path)
+        os.replace(tmp_path, target)
+    except OSError:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 def get_current_language():
     """
@@ -59,11 +113,22 @@ def get_current_language():
     if not readme_path.exists():
         return 'unknown'
 
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        first_line = f.readline()
+    # 优先读取标记文件；README 在其之后被修改则视为失效
+    # Prefer the sentinel; it is stale if README changed after it was written
+    sentinel_path = Path(LANG_SENTINEL)
+    try:
+        if sentinel_path.stat().st_mtime >= readme_path.stat().st_mtime:
+            lang = SENTINEL_LANGS.get(sentinel_path.read_bytes()[:1])
+            if lang:
+                return lang
+    except OSError:
+        pass
+
+    with open(readme_path, 'rb') as f:
+        first_line = f.readline(256)  # 限制读取长度 / Bound the read length
 
     # 如果第一行包含中文字符，则为中文
-    if any('\u4e00' <= char <= '\u9fff' for char in first_line):
+    if CJK_RE.search(first_line):
         return 'zh'
     else:
         return 'en'
@@ -92,34 +157,38 @@ def switch_language(target_lang):
 
     success_count = 0
     fail_count = 0
+    existing_files = list_existing_files()
 
-    for doc_name, lang_files in DOCS.items():
-        source_file = lang_files[target_lang]
+    # 切换过程中文件可能只切换了一部分，先移除旧的标记
+    # Drop the old sentinel first; a partial switch must not leave it behind
+    if LANG_SENTINEL in existing_files:
+        os.remove(LANG_SENTINEL)
 
-        if not Path(source_file).exists():
+    for doc_name, source_file in DOC_PAIRS[target_lang]:
+        if source_file not in existing_files:
             print(f"⚠️  跳过 / Skip: {doc_name} (未找到{LANG_NAMES[target_lang]}版本 / {LANG_NAMES[target_lang]} version not found)")
             fail_count += 1
             continue
 
-        # 创建符号链接或复制文件
         # 由于符号链接在某些系统上可能有问题，这里使用复制
-        # Create symbolic link or copy file
         # Use copy instead of symlink for better compatibility
         try:
+            if doc_name == source_file:
+                print(f"○ {doc_name} (无需更改 / No change needed)")
+                continue
+
             # 备份当前文件（如果需要）
             # Backup current file (if needed)
-            if Path(doc_name).exists() and doc_name != source_file:
+            if doc_name in existing_files:
                 backup_path = Path(doc_name).with_suffix('.md.bak')
-                shutil.copy(doc_name, backup_path)
-
-            # 复制目标语言文件到主文件名
-            # Copy target language file to main filename
-            if doc_name != source_file:
-                shutil.copy(source_file, doc_name)
-                print(f"✓ {doc_name} → {source_file}")
-                success_count += 1
-            else:
-                print(f"○ {doc_name} (无需更改 / No change needed)")
+                copy_replace(doc_name, backup_path)
+                existing_files.add(backup_path.name)
+
+            # 安装目标语言文件到主文件名
+            # Install target language file under the main filename
+            copy_replace(source_file, doc_name)
+            print(f"✓ {doc_name} → {source_file}")
+            success_count += 1
         except Exception as e:
             print(f"❌ 失败 / Failed: {doc_name} - {e}")
             fail_count += 1
@@ -127,6 +196,10 @@ def switch_language(target_lang):
     print()
     print("=" * 60)
     if fail_count == 0:
+        # 仅在确实替换了文件时记录，否则由 README 内容判断
+        # Only record when files were actually replaced; otherwise detect from README
+        if success_count:
+            Path(LANG_SENTINEL).write_bytes(target_lang[0].encode())
         print(f"✅ 语言切换完成 / Language switched successfully!")
         print(f"   成功 / Success: {success_count} 个文件 / files")
         print(f"   当前语言 / Current language: {LANG_NAMES[target_lang]}")
@@ -152,9 +225,11 @@ def show_status():
     print("可用文档 / Available Documents:")
     print()
 
+    existing_files = list_existing_files()
+
     for doc_name, lang_files in DOCS.items():
-        zh_exists = "✓" if Path(lang_files['zh']).exists() else "✗"
-        en_exists = "✓" if Path(lang_files['en']).exists() else "✗"
+        zh_exists = "✓" if lang_files['zh'] in existing_files else "✗"
+        en_exists = "✓" if lang_files['en'] in existing_files else "✗"
         print(f"  {doc_name:20s}  中文:{zh_exists}  English:{en_exists}")
 
     print()
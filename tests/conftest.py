@@ -1,13 +1,20 @@
 """Pytest configuration and fixtures"""
 
 import pytest
+from unittest.mock import Mock
+from app.agents.models import DraftQuestion, WorkflowContext
+from app.models.question_item import QuestionItem
 from app.models.user_config import UserConfig
 
 
-@pytest.fixture
-def sample_resume():
-    """Sample resume text for testing"""
-    return """
+def pytest_configure(config):
+    """Register custom markers"""
+    config.addinivalue_line(
+        "markers", "slow: long-running integration tests (deselect with -m \"not slow\")"
+    )
+
+
+SAMPLE_RESUME = """
 姓名：张三
 教育背景：清华大学 计算机科学与技术 本科
 
@@ -26,9 +33,15 @@ def sample_resume():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_resume():
+    """Sample resume text for testing"""
+    return SAMPLE_RESUME
+
+
+@pytest.fixture(scope="session")
 def job_config(sample_resume):
-    """Job mode configuration"""
+    """Job mode configuration (shared across the session, do not mutate)"""
     return UserConfig(
         mode='job',
         target_desc='字节跳动后端开发工程师',
@@ -37,12 +50,83 @@ def job_config(sample_resume):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grad_config(sample_resume):
-    """Grad mode configuration"""
+    """Grad mode configuration (shared across the session, do not mutate)"""
     return UserConfig(
         mode='grad',
         target_desc='计算机视觉方向研究生',
         domain='cv_segmentation',
         resume_text=sample_resume
     )
+
+
+@pytest.fixture(scope="session")
+def shared_llm():
+    """LLM stand-in for tests that only hand it to a constructor; tests that stub call_json create their own Mock"""
+    return Mock(name="shared_llm")
+
+
+@pytest.fixture(scope="module")
+def job_user_config():
+    """Minimal job mode configuration (shared within a module, do not mutate)"""
+    return UserConfig(
+        target_desc="Software Engineer",
+        mode="job",
+        resume_text="Test resume"
+    )
+
+
+@pytest.fixture(scope="module")
+def grad_user_config():
+    """Minimal grad mode configuration (shared within a module, do not mutate)"""
+    return UserConfig(
+        target_desc="PhD in CS",
+        mode="grad",
+        resume_text="Test resume"
+    )
+
+
+@pytest.fixture(scope="module")
+def mixed_user_config():
+    """Minimal mixed mode configuration (shared within a module, do not mutate)"""
+    return UserConfig(
+        target_desc="Research Engineer",
+        mode="mixed",
+        resume_text="Test resume"
+    )
+
+
+@pytest.fixture
+def job_context(job_user_config):
+    """Fresh workflow context for job mode (function-scoped, tests record into it)"""
+    return WorkflowContext(job_user_config, "Test resume")
+
+
+@pytest.fixture(scope="module")
+def sample_draft_question():
+    """Valid draft question (shared within a module, do not mutate)"""
+    return DraftQuestion(
+        question="Test question?",
+        rationale="This is a valid test rationale with sufficient length",
+        role_name="test",
+        role_display="Test",
+        confidence=0.8
+    )
+
+
+@pytest.fixture(scope="module")
+def make_question_item():
+    """Factory for valid final question items; keyword overrides replace the defaults"""
+    def _make(id=1, view_role="Test", tag="test", **overrides):
+        fields = dict(
+            question="Test question?",
+            rationale="This is a test rationale for question",
+            baseline_answer="This is a baseline answer structure for testing purposes only",
+            support_notes="Test support notes",
+            prompt_template="This is a test prompt template for testing"
+        )
+        fields.update(overrides)
+        return QuestionItem(id=id, view_role=view_role, tag=tag, **fields)
+
+    return _make
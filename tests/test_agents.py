@@ -1,5 +1,6 @@
 """Tests for multi-agent system"""
 import pytest
+from pydantic import ValidationError
 from unittest.mock import Mock, AsyncMock, patch
 from app.agents.base_agent import BaseAgent, AgentConfig
 from app.agents.models import DraftQuestion, AgentState, WorkflowContext
@@ -9,7 +10,7 @@ from app.agents.hr_agent import HRAgent
 from app.agents.advisor_agent import AdvisorAgent
 from app.agents.reviewer_agent import ReviewerAgent
 from app.agents.advocate_agent import AdvocateAgent
-from app.models.user_config import UserConfig
+from app.core.llm_client import LLMClient
 
 
 class TestAgentConfig:
@@ -66,20 +67,9 @@ class TestDraftQuestion:
         assert draft.confidence == 0.85
         assert "test" in draft.tags
 
-    def test_draft_question_validation_min_length(self):
-        """Test question validation for minimum length"""
-        with pytest.raises(Exception):  # Pydantic raises ValidationError
-            DraftQuestion(
-                question="Too short",  # Less than 10 chars
-                rationale="Valid rationale here",
-                role_name="test",
-                role_display="Test",
-                confidence=0.8
-            )
-
     def test_draft_question_confidence_range(self):
         """Test confidence must be between 0 and 1"""
-        with pytest.raises(Exception):  # Pydantic raises ValidationError
+        with pytest.raises(ValidationError):
             DraftQuestion(
                 question="Valid question here?",
                 rationale="Valid rationale here",
@@ -102,19 +92,11 @@ class TestAgentState:
         assert state.total_cost_estimate == 0.0
         assert state.workflow_id  # Should have a UUID
 
-    def test_agent_state_tracks_proposals(self):
+    def test_agent_state_tracks_proposals(self, sample_draft_question):
         """Test agent state tracks proposals"""
         state = AgentState(mode="job")
 
-        draft = DraftQuestion(
-            question="Test question?",
-            rationale="This is a valid test rationale with sufficient length",
-            role_name="test",
-            role_display="Test",
-            confidence=0.8
-        )
-
-        state.proposals["test_agent"] = [draft]
+        state.proposals["test_agent"] = [sample_draft_question]
 
         assert len(state.proposals) == 1
         assert "test_agent" in state.proposals
@@ -123,90 +105,59 @@ class TestAgentState:
 class TestWorkflowContext:
     """Tests for WorkflowContext"""
 
-    def test_workflow_context_initialization(self):
+    def test_workflow_context_initialization(self, job_user_config):
         """Test workflow context initialization"""
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
+        context = WorkflowContext(job_user_config, "Test resume")
 
-        context = WorkflowContext(user_config, "Test resume")
-
-        assert context.user_config == user_config
+        assert context.user_config == job_user_config
         assert context.resume_text == "Test resume"
         assert context.state.mode == "job"
 
-    def test_workflow_context_record_proposal(self):
-        """Test recording proposals"""
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
-        context = WorkflowContext(user_config, "Test resume")
+    def test_workflow_context_records(self, job_context, sample_draft_question):
+        """Test recording proposals, errors and LLM calls on one context"""
+        job_context.record_proposal("test_agent", [sample_draft_question], latency=1.5)
+        job_context.record_error("failed_agent", "Test error")
+        job_context.record_llm_call(tokens=1000, cost=0.05)
+        job_context.record_llm_call(tokens=2000, cost=0.10)
 
-        draft = DraftQuestion(
-            question="Test question?",
-            rationale="This is a valid test rationale with sufficient length",
-            role_name="test",
-            role_display="Test",
-            confidence=0.8
-        )
-
-        context.record_proposal("test_agent", [draft], latency=1.5)
-
-        assert "test_agent" in context.state.proposals
-        assert context.state.proposal_latencies["test_agent"] == 1.5
-
-    def test_workflow_context_record_error(self):
-        """Test recording errors"""
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
-        context = WorkflowContext(user_config, "Test resume")
-
-        context.record_error("test_agent", "Test error")
-
-        assert "test_agent" in context.state.proposal_errors
-        assert len(context.state.errors) == 1
-
-    def test_workflow_context_record_llm_call(self):
-        """Test recording LLM calls"""
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
-        context = WorkflowContext(user_config, "Test resume")
-
-        context.record_llm_call(tokens=1000, cost=0.05)
-        context.record_llm_call(tokens=2000, cost=0.10)
-
-        assert context.state.total_llm_calls == 2
-        assert context.state.total_tokens == 3000
-        assert abs(context.state.total_cost_estimate - 0.15) < 0.001  # Floating point comparison
+        state = job_context.state
+        assert "test_agent" in state.proposals
+        assert state.proposal_latencies["test_agent"] == 1.5
+        assert "failed_agent" in state.proposal_errors
+        assert len(state.errors) == 1
+        assert state.total_llm_calls == 2
+        assert state.total_tokens == 3000
+        assert abs(state.total_cost_estimate - 0.15) < 0.001  # Floating point comparison
+
+
+class TestAgentInitialization:
+    """Tests for role agent initialization"""
+
+    @pytest.mark.parametrize("agent_cls, name, display_name", [
+        (TechnicalInterviewerAgent, "technical_interviewer", "技术面试官"),
+        (HiringManagerAgent, "hiring_manager", "招聘经理"),
+        (HRAgent, "hr_specialist", "HR专员"),
+        (AdvisorAgent, "academic_advisor", "学术导师"),
+        (ReviewerAgent, "academic_reviewer", "学术评审"),
+        (AdvocateAgent, "candidate_advocate", "候选人倡导者"),
+    ])
+    def test_agent_initialization(self, shared_llm, agent_cls, name, display_name):
+        """Test each role agent is configured with its name and display name"""
+        agent = agent_cls(shared_llm)
+
+        assert agent.config.name == name
+        assert agent.config.display_name == display_name
+        assert agent.llm_client == shared_llm
 
 
 class TestTechnicalInterviewerAgent:
     """Tests for TechnicalInterviewerAgent"""
 
-    def test_technical_agent_initialization(self):
-        """Test technical agent initialization"""
-        mock_llm = Mock()
-        agent = TechnicalInterviewerAgent(mock_llm)
-
-        assert agent.config.name == "technical_interviewer"
-        assert agent.config.display_name == "技术面试官"
-        assert agent.llm_client == mock_llm
-
     @pytest.mark.asyncio
-    async def test_technical_agent_propose_questions_success(self):
+    async def test_technical_agent_propose_questions_success(self, job_user_config):
         """Test technical agent proposes questions successfully"""
-        mock_llm = Mock()
-        mock_llm.call_json = AsyncMock(return_value={
+        mock_llm = Mock(spec=LLMClient)
+        mock_llm.call_json = AsyncMock(spec=LLMClient.call_json, return_value={
             "questions": [
                 {
                     "question": "请描述你在分布式系统项目中遇到的最大技术挑战是什么？",
@@ -219,47 +170,22 @@ class TestTechnicalInterviewerAgent:
         })
 
         agent = TechnicalInterviewerAgent(mock_llm)
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
 
-        questions = await agent.propose_questions("Test resume", user_config)
+        questions = await agent.propose_questions("Test resume", job_user_config)
 
         assert len(questions) > 0
         assert isinstance(questions[0], DraftQuestion)
         assert questions[0].role_name == "technical_interviewer"
 
 
-class TestHiringManagerAgent:
-    """Tests for HiringManagerAgent"""
-
-    def test_hiring_manager_initialization(self):
-        """Test hiring manager initialization"""
-        mock_llm = Mock()
-        agent = HiringManagerAgent(mock_llm)
-
-        assert agent.config.name == "hiring_manager"
-        assert agent.config.display_name == "招聘经理"
-
-
 class TestHRAgent:
     """Tests for HRAgent"""
 
-    def test_hr_agent_initialization(self):
-        """Test HR agent initialization"""
-        mock_llm = Mock()
-        agent = HRAgent(mock_llm)
-
-        assert agent.config.name == "hr_specialist"
-        assert agent.config.display_name == "HR专员"
-
     @pytest.mark.asyncio
-    async def test_hr_agent_propose_questions(self):
+    async def test_hr_agent_propose_questions(self, job_user_config):
         """Test HR agent proposes soft skill questions"""
-        mock_llm = Mock()
-        mock_llm.call_json = AsyncMock(return_value={
+        mock_llm = Mock(spec=LLMClient)
+        mock_llm.call_json = AsyncMock(spec=LLMClient.call_json, return_value={
             "questions": [
                 {
                     "question": "请描述一次你在团队中遇到意见分歧的经历，你是如何处理的？",
@@ -272,13 +198,8 @@ class TestHRAgent:
         })
 
         agent = HRAgent(mock_llm)
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
 
-        questions = await agent.propose_questions("Test resume", user_config)
+        questions = await agent.propose_questions("Test resume", job_user_config)
 
         assert len(questions) > 0
         assert "软技能" in questions[0].tags or "团队协作" in questions[0].tags
@@ -287,27 +208,12 @@ class TestHRAgent:
 class TestAdvisorAgent:
     """Tests for AdvisorAgent"""
 
-    def test_advisor_agent_initialization(self):
-        """Test advisor agent initialization"""
-        mock_llm = Mock()
-        agent = AdvisorAgent(mock_llm)
-
-        assert agent.config.name == "academic_advisor"
-        assert agent.config.display_name == "学术导师"
-
     @pytest.mark.asyncio
-    async def test_advisor_agent_skips_job_mode(self):
+    async def test_advisor_agent_skips_job_mode(self, shared_llm, job_user_config):
         """Test advisor agent returns empty for job mode"""
-        mock_llm = Mock()
-        agent = AdvisorAgent(mock_llm)
+        agent = AdvisorAgent(shared_llm)
 
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
-
-        questions = await agent.propose_questions("Test resume", user_config)
+        questions = await agent.propose_questions("Test resume", job_user_config)
 
         assert len(questions) == 0  # Should skip for job mode
 
@@ -315,27 +221,12 @@ class TestAdvisorAgent:
 class TestReviewerAgent:
     """Tests for ReviewerAgent"""
 
-    def test_reviewer_agent_initialization(self):
-        """Test reviewer agent initialization"""
-        mock_llm = Mock()
-        agent = ReviewerAgent(mock_llm)
-
-        assert agent.config.name == "academic_reviewer"
-        assert agent.config.display_name == "学术评审"
-
     @pytest.mark.asyncio
-    async def test_reviewer_agent_skips_job_mode(self):
+    async def test_reviewer_agent_skips_job_mode(self, shared_llm, job_user_config):
         """Test reviewer agent returns empty for job mode"""
-        mock_llm = Mock()
-        agent = ReviewerAgent(mock_llm)
+        agent = ReviewerAgent(shared_llm)
 
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
-
-        questions = await agent.propose_questions("Test resume", user_config)
+        questions = await agent.propose_questions("Test resume", job_user_config)
 
         assert len(questions) == 0  # Should skip for job mode
 
@@ -343,19 +234,11 @@ class TestReviewerAgent:
 class TestAdvocateAgent:
     """Tests for AdvocateAgent"""
 
-    def test_advocate_agent_initialization(self):
-        """Test advocate agent initialization"""
-        mock_llm = Mock()
-        agent = AdvocateAgent(mock_llm)
-
-        assert agent.config.name == "candidate_advocate"
-        assert agent.config.display_name == "候选人倡导者"
-
     @pytest.mark.asyncio
-    async def test_advocate_agent_proposes_questions(self):
+    async def test_advocate_agent_proposes_questions(self, job_user_config):
         """Test advocate agent proposes fairness questions"""
-        mock_llm = Mock()
-        mock_llm.call_json = AsyncMock(return_value={
+        mock_llm = Mock(spec=LLMClient)
+        mock_llm.call_json = AsyncMock(spec=LLMClient.call_json, return_value={
             "questions": [
                 {
                     "question": "你简历中最引以为豪的成就是什么？",
@@ -368,40 +251,24 @@ class TestAdvocateAgent:
         })
 
         agent = AdvocateAgent(mock_llm)
-        user_config = UserConfig(
-            target_desc="Software Engineer",
-            mode="job",
-            resume_text="Test resume"
-        )
 
-        questions = await agent.propose_questions("Test resume", user_config)
+        questions = await agent.propose_questions("Test resume", job_user_config)
 
         assert len(questions) > 0
         assert questions[0].metadata.get("purpose") == "highlight_strengths"
 
 
-class TestBaseAgentValidation:
-    """Tests for BaseAgent validation methods"""
-
-    def test_validate_draft_question_success(self):
-        """Test validation accepts valid question"""
-        mock_llm = Mock()
-        agent = TechnicalInterviewerAgent(mock_llm)
+@pytest.fixture(scope="module")
+def validation_agent(shared_llm):
+    """Agent shared by the validation tests (validate_draft_question is stateless)"""
+    return TechnicalInterviewerAgent(shared_llm)
 
-        draft = DraftQuestion(
-            question="This is a valid question with sufficient length?",
-            rationale="This is a valid rationale with sufficient detail",
-            role_name="test",
-            role_display="Test",
-            confidence=0.85
-        )
 
-        assert agent.validate_draft_question(draft) is True
+class TestBaseAgentValidation:
+    """Tests for BaseAgent validation methods"""
 
     def test_validate_draft_question_too_short(self):
         """Test Pydantic validation rejects too short question"""
-        from pydantic import ValidationError
-        
         # Pydantic should catch this at construction time
         with pytest.raises(ValidationError):
             DraftQuestion(
@@ -412,22 +279,22 @@ class TestBaseAgentValidation:
                 confidence=0.85
             )
 
-    def test_validate_draft_question_invalid_confidence(self):
-        """Test validation rejects invalid confidence"""
-        mock_llm = Mock()
-        agent = TechnicalInterviewerAgent(mock_llm)
-
-        # Confidence outside 0-1 range should be caught by Pydantic
-        # But we test the validate method's own checks
+    @pytest.mark.parametrize("confidence, expected", [
+        (0.85, True),
+        (1.5, False),
+        (-0.1, False),
+    ], ids=["valid", "above_range", "below_range"])
+    def test_validate_draft_question_confidence(self, validation_agent, confidence, expected):
+        """Test validation checks the confidence range itself"""
         draft = DraftQuestion(
-            question="Valid question here?",
-            rationale="This is a valid rationale with sufficient length",
+            question="This is a valid question with sufficient length?",
+            rationale="This is a valid rationale with sufficient detail",
             role_name="test",
             role_display="Test",
             confidence=0.5  # Valid value
         )
 
-        # Manually set invalid confidence (bypassing Pydantic)
-        draft.confidence = 1.5
+        # Set confidence after construction, bypassing Pydantic's range check
+        draft.confidence = confidence
 
-        assert agent.validate_draft_question(draft) is False
+        assert validation_agent.validate_draft_question(draft) is expected
@@ -12,18 +12,27 @@ class TestConfigValidator:
     def test_validate_domains_config_success(self):
         """Test validation of valid domains config"""
         # Use real config file
-        from app.config.settings import settings
+        from app.config.settings import get_settings
 
+        settings = get_settings()
         result = ConfigValidator.validate_domains_config(settings.DOMAINS_CONFIG)
         assert result is True
 
     def test_validate_modes_config_success(self):
         """Test validation of valid modes config"""
-        from app.config.settings import settings
+        from app.config.settings import get_settings
 
+        settings = get_settings()
         result = ConfigValidator.validate_modes_config(settings.MODES_CONFIG)
         assert result is True
 
+    def test_get_settings_is_cached(self):
+        """Test settings are built once and shared with the module-level instance"""
+        from app.config.settings import get_settings, settings
+
+        assert get_settings() is get_settings()
+        assert get_settings() is settings
+
     def test_validate_all_success(self):
         """Test validation of all configs"""
         result = ConfigValidator.validate_all()